@@ -29,11 +29,7 @@ def plugins_health():
     plugins_status = []
     for plugin_id, meta in core.registry.items():
         is_loaded = plugin_id in core.loader.loaded_plugins
-        cls = core.loader._plugin_classes.get(plugin_id)
-        needs_eager = (
-            getattr(cls, 'EAGER_LOAD', None) is True
-            or (cls is not None and '__init__' in cls.__dict__)
-        )
+        needs_eager = core.loader.is_eager(plugin_id)
         plugins_status.append({
             "id": plugin_id,
             "name": meta.name,
@@ -13,6 +13,7 @@ import hmac
 import hashlib
 import json
 import logging
+import time
 from datetime import datetime
 from enum import Enum
 
@@ -65,7 +66,8 @@ class WebhookProcessor:
             result = await self.analyze_text(text, plugin_id, payload)
             
             self.stats["total_processed"] += 1
-            self.stats["last_processed"] = datetime.now().isoformat()
+            # ns inteiro no caminho quente; ISO só quando /stats é lido
+            self.stats["last_processed"] = time.time_ns()
             
             # Track metrics
             if track_webhook_callback:
@@ -89,6 +91,14 @@ class WebhookProcessor:
             logging.getLogger("qualia.api").error("Webhook error: %s", e, exc_info=True)
             raise HTTPException(status_code=500, detail="Erro interno no processamento do webhook")
     
+    def stats_snapshot(self) -> Dict[str, Any]:
+        """Cópia das estatísticas com last_processed formatado em ISO."""
+        snapshot = dict(self.stats)
+        ns = snapshot["last_processed"]
+        if ns is not None:
+            snapshot["last_processed"] = datetime.fromtimestamp(ns / 1e9).isoformat()
+        return snapshot
+    
     async def verify_signature(self, payload: Dict[str, Any], headers: Dict[str, str]) -> bool:
         """Verify webhook signature. Override in subclasses."""
         return True  # Default: no verification
@@ -185,7 +195,7 @@ async def webhook_stats():
     """Get webhook processing statistics."""
     stats = {}
     for webhook_type, processor in processors.items():
-        stats[webhook_type.value] = processor.stats
+        stats[webhook_type.value] = processor.stats_snapshot()
     
     return {
         "status": "ok",
@@ -10,10 +10,9 @@ from pathlib import Path
 from typing import Dict, Any
 from rich.prompt import Prompt, IntPrompt, FloatPrompt, Confirm
 from rich.panel import Panel
-from rich.syntax import Syntax
 
 from qualia.core import PluginType
-from .utils import get_core, console
+from .utils import get_core, console, YAML_SUFFIXES
 
 
 def prompt_for_value(param_name: str, param_info: Dict[str, Any]) -> Any:
@@ -158,6 +157,8 @@ def create(plugin: str, output: str, format: str):
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
     # Mostrar preview
+    # rich.syntax puxa pygments (~17 ms) — só carrega quando há preview
+    from rich.syntax import Syntax
     console.print("\n[bold]Preview da configuração:[/bold]")
     if format == 'yaml':
         preview = yaml.dump(final_config, default_flow_style=False, allow_unicode=True)
@@ -202,7 +203,7 @@ def validate(config_file: str, plugin: str):
     
     try:
         # Ler arquivo
-        if config_path.suffix in ['.yaml', '.yml']:
+        if config_path.suffix in YAML_SUFFIXES:
             with open(config_path, 'r', encoding='utf-8') as f:
                 data = yaml.safe_load(f)
         else:
@@ -289,7 +290,7 @@ def list_configs():
     
     for f in all_files:
         try:
-            if f.suffix in ['.yaml', '.yml']:
+            if f.suffix in YAML_SUFFIXES:
                 data = yaml.safe_load(f.read_text())
             else:
                 data = json.loads(f.read_text())
@@ -11,7 +11,7 @@ from pathlib import Path
 from typing import Dict, Any, List
 from rich.table import Table as RichTable
 
-from .utils import console
+from .utils import console, load_data, DATA_SUFFIXES
 
 
 def export_to_csv(data: Dict[str, Any], output_path: Path):
@@ -281,18 +281,12 @@ def export(input_file: str, format: str, output: str, pretty: bool):
     # Ler arquivo de entrada
     input_path = Path(input_file)
     
+    if input_path.suffix not in DATA_SUFFIXES:
+        console.print("[red]Formato de entrada não suportado. Use JSON ou YAML.[/red]")
+        raise SystemExit(1)
+
     try:
-        if input_path.suffix in ['.json']:
-            with open(input_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-        elif input_path.suffix in ['.yaml', '.yml']:
-            with open(input_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-        else:
-            console.print("[red]Formato de entrada não suportado. Use JSON ou YAML.[/red]")
-            raise SystemExit(1)
-    except SystemExit:
-        raise
+        data = load_data(input_path)
     except Exception as e:
         console.print(f"[red]Erro ao ler arquivo: {str(e)}[/red]")
         raise SystemExit(1)
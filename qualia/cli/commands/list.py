@@ -3,6 +3,8 @@
 Comandos para listar plugins disponíveis
 """
 
+import json
+
 import click
 from rich.table import Table
 
@@ -44,9 +46,7 @@ def _run_check(core, type_filter: str):
     table.add_column("Status", style="green")
 
     for plugin in sorted(plugins, key=lambda p: p.id):
-        cls = core.loader._plugin_classes.get(plugin.id)
-        is_eager = cls is not None and '__init__' in getattr(cls, '__dict__', {})
-        loading = "eager" if is_eager else "lazy"
+        loading = "eager" if core.loader.is_eager(plugin.id) else "lazy"
         table.add_row(plugin.id, plugin.type.value, loading, "✓ saudável")
 
     console.print(table)
@@ -80,7 +80,9 @@ def _run_check(core, type_filter: str):
               help='Tipo de plugin para listar')
 @click.option('--detailed', '-d', is_flag=True, help='Mostrar informações detalhadas')
 @click.option('--check', '-c', is_flag=True, help='Diagnóstico de saúde dos plugins')
-def list_plugins(type: str, detailed: bool, check: bool):
+@click.option('--json', 'as_json', is_flag=True,
+              help='Saída em JSON (para scripts e outros processos)')
+def list_plugins(type: str, detailed: bool, check: bool, as_json: bool):
     """Lista plugins disponíveis"""
     core = get_core()
 
@@ -94,6 +96,22 @@ def list_plugins(type: str, detailed: bool, check: bool):
     else:
         plugin_type = PluginType(type)
         plugins = [p for p in core.registry.values() if p.type == plugin_type]
+
+    if as_json:
+        # stdout cru (sem Rich): consumidor faz json.loads direto
+        click.echo(json.dumps([
+            {
+                "id": p.id,
+                "type": p.type.value,
+                "name": p.name,
+                "version": p.version,
+                "description": p.description,
+                "provides": list(p.provides),
+                "requires": list(p.requires),
+            }
+            for p in plugins
+        ], ensure_ascii=False))
+        return
     
     if not plugins:
         console.print(f"[yellow]Nenhum plugin do tipo '{type}' encontrado.[/yellow]")
@@ -12,7 +12,7 @@ from rich.progress import Progress
 
 from qualia.core import PipelineConfig, PipelineStep, PluginType
 from qualia.core.models import extract_chained_text
-from .utils import get_core, console, make_doc_id
+from .utils import get_core, console, make_doc_id, YAML_SUFFIXES
 
 
 @click.command()
@@ -27,7 +27,7 @@ def pipeline(document_path: str, config: str, output_dir: str):
     
     # Carregar configuração do pipeline
     config_path = Path(config)
-    if config_path.suffix in ['.yaml', '.yml']:
+    if config_path.suffix in YAML_SUFFIXES:
         pipeline_data = yaml.safe_load(config_path.read_text())
     else:
         pipeline_data = json.loads(config_path.read_text())
@@ -7,6 +7,8 @@ from typing import Optional, Dict, Any
 from pathlib import Path
 import hashlib
 import json
+import mmap
+import os
 import click
 import yaml
 from rich.console import Console
@@ -20,24 +22,45 @@ console = Console()
 _core: Optional[QualiaCore] = None
 
 
+def plugin_index_path() -> Path:
+    """Índice de warm-start do discovery em $XDG_CACHE_HOME/qualia (default ~/.cache)."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "qualia" / "plugin_index.json"
+
+
 def get_core() -> QualiaCore:
     """Obtém instância do core com lazy loading.
 
     QualiaCore.__init__ já chama discover_plugins() — não chamar de novo.
+    A CLI usa o índice de warm-start: plugins inalterados não são importados
+    no startup, só quando usados.
     """
     global _core
     if _core is None:
         with console.status("[bold green]Descobrindo plugins..."):
-            _core = QualiaCore()
+            _core = QualiaCore(plugin_index=plugin_index_path())
     return _core
 
 
+# Extensões tratadas como YAML — o resto é lido como JSON
+YAML_SUFFIXES = frozenset({'.yaml', '.yml'})
+
+
+def _load_yaml(path: Path) -> Any:
+    return yaml.safe_load(path.read_text())
+
+
+def _load_json(path: Path) -> Any:
+    return json.loads(path.read_text())
+
+
+_CONFIG_LOADERS = {'.yaml': _load_yaml, '.yml': _load_yaml, '.json': _load_json}
+
+
 def load_config(config_path: Path) -> Dict[str, Any]:
     """Carrega arquivo de configuração YAML ou JSON. Falha se não for dict."""
-    if config_path.suffix in ['.yaml', '.yml']:
-        data = yaml.safe_load(config_path.read_text())
-    else:
-        data = json.loads(config_path.read_text())
+    load = _CONFIG_LOADERS.get(config_path.suffix.lower(), _load_json)
+    data = load(config_path)
     if not isinstance(data, dict):
         raise click.BadParameter(
             f"Config deve ser um objeto (dict), não {type(data).__name__}. "
@@ -46,6 +69,50 @@ def load_config(config_path: Path) -> Dict[str, Any]:
     return data
 
 
+# Formatos aceitos como entrada de dados (visualize, export)
+DATA_SUFFIXES = YAML_SUFFIXES | {'.json'}
+
+# Acima disso, JSON é lido via mmap (zero-copy) se orjson estiver instalado
+_MMAP_THRESHOLD = 1_000_000
+
+
+def _read_json(data_path: Path) -> Any:
+    """Lê JSON. Arquivos grandes vão por mmap + orjson — evita a cópia em str.
+
+    orjson (extra 'fast') rejeita NaN/Infinity, que o json.dumps dos resultados
+    grava — nesse caso cai no json.load, igual aos arquivos pequenos.
+    """
+    if data_path.stat().st_size > _MMAP_THRESHOLD:
+        try:
+            import orjson
+        except ImportError:
+            orjson = None
+        if orjson is not None:
+            try:
+                with open(data_path, 'rb') as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                        memoryview(mm) as buf:
+                    return orjson.loads(buf)
+            except orjson.JSONDecodeError:
+                pass
+    with open(data_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_data(data_path: Path) -> Any:
+    """Carrega arquivo de dados JSON ou YAML (qualquer estrutura, não só dict)."""
+    if data_path.suffix in YAML_SUFFIXES:
+        with open(data_path, 'r', encoding='utf-8') as f:
+            return yaml.safe_load(f)
+    if data_path.suffix == '.json':
+        return _read_json(data_path)
+    raise ValueError(f"Formato de dados não suportado: {data_path.suffix or data_path.name}")
+
+
+# Primeiros caracteres possíveis de um valor JSON (inclui NaN/Infinity aceitos pelo json)
+_JSON_FIRST = frozenset('{["tfn-0123456789NI')
+
+
 def parse_params(param_list: tuple) -> Dict[str, Any]:
     """Converte lista de parâmetros key=value em dicionário"""
     params = {}
@@ -61,13 +128,16 @@ def parse_params(param_list: tuple) -> Dict[str, Any]:
             params[key] = value.lower() == 'true'
         elif value.isdigit():
             params[key] = int(value)
-        else:
+        elif value.lstrip()[:1] in _JSON_FIRST:
             try:
                 # Tenta como JSON para arrays, objetos, etc
                 params[key] = json.loads(value)
             except (json.JSONDecodeError, ValueError):
                 # Mantém como string
                 params[key] = value
+        else:
+            # Não tem como ser JSON — evita o custo da exceção
+            params[key] = value
                 
     return params
 
@@ -82,34 +152,43 @@ def make_doc_id(file_path: Path, content: str) -> str:
     return f"{file_path.stem}_{content_hash}"
 
 
+# Chaves já exibidas acima (ou volumosas demais) no display_result_pretty
+_PRETTY_SKIP_KEYS = frozenset({
+    'word_frequencies', 'top_words', 'vocabulary_size',
+    'total_words', 'parameters_used', 'hapax_legomena',
+})
+# Acima disso a coleção é exibida como complexa sem passar por str()
+_COMPLEX_MAX_ITEMS = 20
+
+
 def display_result_pretty(plugin_name: str, result: Dict[str, Any]):
-    """Exibe resultado de forma formatada"""
-    console.print(f"\n[bold]Resultado: {plugin_name}[/bold]")
-    
+    """Exibe resultado de forma formatada (monta tudo e imprime numa chamada só)"""
+    lines = [f"\n[bold]Resultado: {plugin_name}[/bold]"]
+
     # Exibir métricas principais
     if 'vocabulary_size' in result:
-        console.print(f"\nVocabulário: [cyan]{result['vocabulary_size']}[/cyan] palavras únicas")
-    
+        lines.append(f"\nVocabulário: [cyan]{result['vocabulary_size']}[/cyan] palavras únicas")
+
     if 'total_words' in result:
-        console.print(f"Total de palavras: [cyan]{result['total_words']}[/cyan]")
-    
+        lines.append(f"Total de palavras: [cyan]{result['total_words']}[/cyan]")
+
     # Top palavras
     if 'top_words' in result and result['top_words']:
-        console.print("\n[bold]Palavras mais frequentes:[/bold]")
+        lines.append("\n[bold]Palavras mais frequentes:[/bold]")
+        max_count = result['top_words'][0][1]
         for word, count in result['top_words'][:10]:
-            max_count = result['top_words'][0][1]
-            if max_count > 0:
-                bar_length = int((count / max_count) * 30)
-            else:
-                bar_length = 0
-            bar = '█' * bar_length
-            console.print(f"  {word:15} {bar} {count}")
-    
+            bar_length = int((count / max_count) * 30) if max_count > 0 else 0
+            lines.append(f"  {word:15} {'█' * bar_length} {count}")
+
     # Outros dados
     for key, value in result.items():
-        if key not in ['word_frequencies', 'top_words', 'vocabulary_size', 
-                      'total_words', 'parameters_used', 'hapax_legomena']:
-            if isinstance(value, (dict, list)) and len(str(value)) > 100:
-                console.print(f"\n{key}: [dim]<dados complexos>[/dim]")
-            else:
-                console.print(f"\n{key}: {value}")
\ No newline at end of file
+        if key in _PRETTY_SKIP_KEYS:
+            continue
+        # Coleção grande já é complexa — não serializa só pra medir
+        if isinstance(value, (dict, list)) and (
+                len(value) > _COMPLEX_MAX_ITEMS or len(str(value)) > 100):
+            lines.append(f"\n{key}: [dim]<dados complexos>[/dim]")
+        else:
+            lines.append(f"\n{key}: {value}")
+
+    console.print("\n".join(lines))
@@ -4,14 +4,11 @@ Comando para visualizar dados com plugins
 """
 
 import click
-import json
-import yaml
 from pathlib import Path
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from qualia.core import PluginType
-from .utils import get_core, console, parse_params, load_config
-
+from .utils import get_core, console, parse_params, load_config, load_data, DATA_SUFFIXES
 
 @click.command()
 @click.argument('data_path', type=click.Path(exists=True))
@@ -37,13 +34,13 @@ def visualize(data_path: str, plugin: str, output: str, config: str,
     core = get_core()
 
     # Verificar se plugin existe
-    if plugin not in core.registry:
+    plugin_meta = core.registry.get(plugin)
+    if plugin_meta is None:
         console.print(f"[red]Plugin '{plugin}' não encontrado![/red]")
         console.print("\nUse 'qualia list -t visualizer' para ver visualizadores disponíveis.")
         raise SystemExit(1)
 
     # Verificar se é visualizer
-    plugin_meta = core.registry[plugin]
     if plugin_meta.type != PluginType.VISUALIZER:
         console.print(f"[red]'{plugin}' não é um visualizador! Tipo: {plugin_meta.type.value}[/red]")
         raise SystemExit(1)
@@ -52,18 +49,12 @@ def visualize(data_path: str, plugin: str, output: str, config: str,
     data_path = Path(data_path)
     console.print(f"[bold]Lendo dados de {data_path.name}...[/bold]")
 
+    if data_path.suffix not in DATA_SUFFIXES:
+        console.print("[red]Formato de dados não suportado! Use JSON ou YAML.[/red]")
+        raise SystemExit(1)
+
     try:
-        if data_path.suffix in ['.json']:
-            with open(data_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-        elif data_path.suffix in ['.yaml', '.yml']:
-            with open(data_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-        else:
-            console.print("[red]Formato de dados não suportado! Use JSON ou YAML.[/red]")
-            raise SystemExit(1)
-    except SystemExit:
-        raise
+        data = load_data(data_path)
     except Exception as e:
         console.print(f"[red]Erro ao ler dados: {str(e)}[/red]")
         raise SystemExit(1)
@@ -121,38 +112,36 @@ def visualize(data_path: str, plugin: str, output: str, config: str,
         task = progress.add_task("Renderizando...", total=None)
 
         try:
-            # Instanciar plugin
-            plugin_instance = core.get_plugin(plugin)
-
-            # Verificar se plugin tem método render
-            if not hasattr(plugin_instance, 'render'):
+            # Instanciar plugin e pegar render numa leitura só (sem hasattr + getattr)
+            render = getattr(core.get_plugin(plugin), 'render', None)
+            if render is None:
                 progress.stop()
                 console.print(f"[red]Plugin '{plugin}' não suporta visualização![/red]")
                 raise SystemExit(1)
 
             # Renderizar — passa output_format, plugin retorna dict
             params_with_format = {**params, "output_format": format_ext}
-            result = plugin_instance.render(data, params_with_format)
+            result = render(data, params_with_format)
             progress.stop()
 
             # Salvar resultado a partir do dict
+            # Tamanho vem do payload já em memória — sem stat() no arquivo recém-escrito
             if "html" in result:
                 if not str(output_path).endswith('.html'):
                     output_path = output_path.with_suffix('.html')
-                output_path.write_text(result["html"], encoding="utf-8")
+                file_size = output_path.write_bytes(result["html"].encode("utf-8"))
             elif "data" in result and result.get("encoding") == "base64":
                 import base64 as b64_mod
                 fmt = result.get("format", "png")
                 if output_path.suffix != f".{fmt}":
                     output_path = output_path.with_suffix(f".{fmt}")
-                output_path.write_bytes(b64_mod.b64decode(result["data"]))
+                file_size = output_path.write_bytes(b64_mod.b64decode(result["data"]))
             else:
                 progress.stop()
                 console.print("[red]✗ Formato de resultado desconhecido retornado pelo plugin.[/red]")
                 raise SystemExit(1)
 
             # Mostrar sucesso
-            file_size = output_path.stat().st_size
             size_str = f"{file_size / 1024:.1f} KB" if file_size < 1024 * 1024 else f"{file_size / 1024 / 1024:.1f} MB"
             console.print(f"\n[green]✓ Visualização criada: {output_path}[/green]")
             console.print(f"  Tamanho: {size_str}")
@@ -4,7 +4,12 @@ Comando para monitorar pasta e processar novos arquivos automaticamente
 """
 
 import click
+import fnmatch
+import json
+import os
+import queue
 import time
+from collections import deque
 from pathlib import Path
 from typing import Optional, Dict, Any
 from rich.live import Live
@@ -17,6 +22,15 @@ from watchdog.events import FileSystemEventHandler, FileCreatedEvent, FileModifi
 from .utils import get_core, console, parse_params, make_doc_id
 
 
+# Buffer de escrita dos resultados — junta os pedaços do json.dump em poucos write()
+_WRITE_BUFFER = 64 * 1024
+
+
+def _escapes(rel: str) -> bool:
+    """True se o path relativo sai da pasta base (começa com '..')."""
+    return rel == os.pardir or rel.startswith(os.pardir + os.sep)
+
+
 class QualiaFileHandler(FileSystemEventHandler):
     """Handler para processar arquivos quando detectados"""
     
@@ -28,9 +42,15 @@ class QualiaFileHandler(FileSystemEventHandler):
         self.config = config
         self.output_dir = output_dir
         self.pattern = pattern
-        self.watch_dir = watch_dir
+        # Padrão sem separador casa só pelo nome — dá pra testar sem montar Path
+        self._name_only_pattern = '/' not in pattern and '\\' not in pattern
+        self.watch_dir = os.path.abspath(watch_dir) if watch_dir else None
         self.core = get_core()
         self.processed_files = set()
+        # (mtime_ns, size) do arquivo no último processamento — descarta eventos repetidos
+        self._last_seen: Dict[str, tuple] = {}
+        # Eventos vão pra fila — quem imprime é a thread principal (Live)
+        self.events: queue.Queue = queue.Queue()
         self.stats = {
             "processed": 0,
             "errors": 0,
@@ -39,16 +59,40 @@ class QualiaFileHandler(FileSystemEventHandler):
         
     def on_created(self, event: FileCreatedEvent):
         """Quando um novo arquivo é criado — espera estabilização antes de processar."""
-        if not event.is_directory:
+        if self._should_handle(event):
             if self._wait_stable(event.src_path):
                 self._process_file(event.src_path)
 
     def on_modified(self, event: FileModifiedEvent):
         """Quando um arquivo é modificado — espera estabilização antes de processar."""
-        if not event.is_directory:
+        if self._should_handle(event):
             if self._wait_stable(event.src_path):
                 self._process_file(event.src_path)
 
+    def _should_handle(self, event) -> bool:
+        """Filtra antes do _wait_stable (que dorme): diretórios, padrão e eventos repetidos.
+
+        Um save gera vários eventos (created + modified...). Depois que o primeiro
+        foi processado, os demais encontram o arquivo com o mesmo (mtime, size)
+        e são descartados com um único stat, sem dormir.
+        """
+        if event.is_directory or not self._matches(event.src_path):
+            return False
+        try:
+            st = os.stat(event.src_path)
+        except OSError:
+            return True  # _wait_stable decide
+        if self._last_seen.get(event.src_path) == (st.st_mtime_ns, st.st_size):
+            self.stats["skipped"] += 1
+            return False
+        return True
+
+    def _matches(self, file_path: str) -> bool:
+        """Verifica o padrão — padrões só de nome não criam Path."""
+        if self._name_only_pattern:
+            return fnmatch.fnmatch(os.path.basename(file_path), self.pattern)
+        return Path(file_path).match(self.pattern)
+
     @staticmethod
     def _wait_stable(file_path: str, checks: int = 3, interval: float = 0.5) -> bool:
         """Espera até que o arquivo pare de mudar (size/mtime estáveis).
@@ -73,23 +117,38 @@ class QualiaFileHandler(FileSystemEventHandler):
             time.sleep(interval)
         return False  # não estabilizou — pular, próximo modified tenta de novo
 
+    def _relative_name(self, file_path: str) -> str:
+        """Nome relativo à pasta monitorada, achatado (sub/doc.txt → sub_doc)."""
+        base = self.watch_dir or os.path.dirname(os.path.abspath(file_path))
+        rel = os.path.relpath(os.path.abspath(file_path), base)
+        if _escapes(rel):
+            # Evento veio por outro caminho (symlink) — só aqui paga o realpath
+            rel = os.path.relpath(os.path.realpath(file_path), os.path.realpath(base))
+            if _escapes(rel):
+                rel = os.path.basename(file_path)
+        return os.path.splitext(rel)[0].replace("/", "_").replace("\\", "_")
+
     def _process_file(self, file_path: str):
         """Processa um arquivo se corresponder ao padrão"""
-        path = Path(file_path)
-        
-        # Verificar padrão
-        if not path.match(self.pattern):
+        # Verificar padrão — eventos descartados não chegam a criar Path
+        if not self._matches(file_path):
             return
-        
+
+        path = Path(file_path)
+
         # Evitar reprocessar imediatamente
         if path in self.processed_files:
             last_modified = path.stat().st_mtime
             if time.time() - last_modified < 2:  # 2 segundos de cooldown
                 return
         
-        console.print(f"\n[cyan]📄 Novo arquivo detectado: {path.name}[/cyan]")
-        
+        self.events.put_nowait(("detected", path.name, ""))
+
         try:
+            # Stat antes da leitura — se o arquivo mudar durante o processamento,
+            # o próximo evento não casa com _last_seen e reprocessa
+            st = os.stat(file_path)
+
             # Ler documento
             try:
                 content = path.read_text(encoding='utf-8')
@@ -106,28 +165,72 @@ class QualiaFileHandler(FileSystemEventHandler):
             
             # Salvar resultado se output_dir especificado
             if self.output_dir:
-                import json
                 # Path relativo à pasta monitorada — evita colisão em modo recursivo
-                base = self.watch_dir or path.parent
-                try:
-                    rel = path.resolve().relative_to(base.resolve())
-                except ValueError:
-                    rel = Path(path.name)
-                safe_name = str(rel.with_suffix("")).replace("/", "_").replace("\\", "_")
-                output_file = self.output_dir / f"{safe_name}_result.json"
-                output_file.write_text(json.dumps(result, indent=2))
-                console.print(f"[green]✓ Processado → {output_file}[/green]")
+                output_file = os.path.join(
+                    self.output_dir, f"{self._relative_name(file_path)}_result.json"
+                )
+                # json.dump direto no arquivo bufferizado — sem montar a string inteira
+                with open(output_file, 'w', buffering=_WRITE_BUFFER) as f:
+                    json.dump(result, f, indent=2)
+                self.events.put_nowait(("ok", path.name, output_file))
             else:
-                console.print(f"[green]✓ Processado com sucesso[/green]")
+                self.events.put_nowait(("ok", path.name, ""))
             
             self.processed_files.add(path)
+            self._last_seen[file_path] = (st.st_mtime_ns, st.st_size)
             self.stats["processed"] += 1
             
         except Exception as e:
-            console.print(f"[red]✗ Erro ao processar {path.name}: {str(e)}[/red]")
+            self.events.put_nowait(("error", path.name, str(e)))
             self.stats["errors"] += 1
 
 
+_EVENT_LABELS = {
+    "detected": "[cyan]📄 detectado[/cyan]",
+    "ok": "[green]✓ processado[/green]",
+    "error": "[red]✗ erro[/red]",
+}
+
+
+def _drain_events(handler: QualiaFileHandler, recent: deque) -> bool:
+    """Move eventos pendentes da fila do handler pro buffer. True se houve algum."""
+    drained = False
+    while True:
+        try:
+            recent.append(handler.events.get_nowait())
+        except queue.Empty:
+            return drained
+        drained = True
+
+
+def _format_event(kind: str, name: str, detail: str) -> str:
+    """Linha de um evento — saída sem terminal (pipe), onde o Live não aparece."""
+    line = f"{_EVENT_LABELS[kind]} {name}"
+    return f"{line} [dim]{detail}[/dim]" if detail else line
+
+
+def _render_table(handler: QualiaFileHandler, recent: deque) -> Table:
+    """Tabela com os últimos eventos e contadores do handler.
+
+    Montada de novo a cada tick com eventos, em vez de reaproveitar uma Table:
+    o Rich não tem API pública pra limpar linhas (as células ficam nas colunas,
+    e rows.clear() sozinho quebra o render), e a tabela tem no máximo 10 linhas.
+    """
+    stats = handler.stats
+    table = Table(
+        caption=f"Processados: [green]{stats['processed']}[/green]  "
+                f"Erros: [red]{stats['errors']}[/red]  "
+                f"Ignorados: [yellow]{stats['skipped']}[/yellow]",
+        expand=True,
+    )
+    table.add_column("Evento", no_wrap=True)
+    table.add_column("Arquivo", style="bold")
+    table.add_column("Detalhe", style="dim")
+    for kind, name, detail in recent:
+        table.add_row(_EVENT_LABELS[kind], name, detail)
+    return table
+
+
 @click.command()
 @click.argument('folder', type=click.Path(exists=True, file_okay=False))
 @click.option('--plugin', '-p', required=True, help='Plugin para executar')
@@ -169,10 +272,10 @@ def watch(folder: str, plugin: str, pattern: str, output_dir: str,
         output_path = None
     
     # Criar handler e observer
-    folder_path = Path(folder).resolve()
+    folder_path = os.path.abspath(folder)
     handler = QualiaFileHandler(plugin, params, output_path, pattern, watch_dir=folder_path)
     observer = Observer()
-    observer.schedule(handler, str(folder_path), recursive=recursive)
+    observer.schedule(handler, folder_path, recursive=recursive)
     
     # Interface de monitoramento
     console.print(Panel(
@@ -188,12 +291,28 @@ def watch(folder: str, plugin: str, pattern: str, output_dir: str,
     # Iniciar monitoramento
     observer.start()
     
+    recent: deque = deque(maxlen=10)
     try:
-        # Loop principal com estatísticas
-        while True:
-            time.sleep(1)
-            # Poderia adicionar live stats aqui se necessário
-            
+        # Única thread que escreve no terminal — handler só enfileira eventos
+        if console.is_terminal:
+            with Live(_render_table(handler, recent), console=console,
+                      refresh_per_second=4) as live:
+                while True:
+                    time.sleep(0.25)
+                    if _drain_events(handler, recent):
+                        live.update(_render_table(handler, recent))
+        else:
+            # Saída em pipe (menu interativo, redirecionamento): o Live só
+            # escreve ao parar, então cada evento vira uma linha assim que chega
+            while True:
+                time.sleep(0.25)
+                while True:
+                    try:
+                        event = handler.events.get_nowait()
+                    except queue.Empty:
+                        break
+                    console.print(_format_event(*event))
+
     except KeyboardInterrupt:
         console.print("\n[yellow]Parando monitoramento...[/yellow]")
         observer.stop()
@@ -201,7 +320,9 @@ def watch(folder: str, plugin: str, pattern: str, output_dir: str,
     observer.join()
     
     # Mostrar estatísticas finais
-    console.print(f"\n[bold]📊 Estatísticas finais:[/bold]")
-    console.print(f"  Processados: [green]{handler.stats['processed']}[/green]")
-    console.print(f"  Erros: [red]{handler.stats['errors']}[/red]")
-    console.print(f"  Ignorados: [yellow]{handler.stats['skipped']}[/yellow]")
\ No newline at end of file
+    console.print(
+        f"\n[bold]📊 Estatísticas finais:[/bold]\n"
+        f"  Processados: [green]{handler.stats['processed']}[/green]\n"
+        f"  Erros: [red]{handler.stats['errors']}[/red]\n"
+        f"  Ignorados: [yellow]{handler.stats['skipped']}[/yellow]"
+    )
\ No newline at end of file
@@ -2,50 +2,56 @@
 Ações de execução extraídas de MenuHandlers — análise, visualização, pipeline.
 """
 
+import os
 from pathlib import Path
-from typing import Optional, TYPE_CHECKING
+from typing import Dict, Optional, Tuple, Union, TYPE_CHECKING
 
 from ..formatters import console, format_success, format_error, format_warning
 
 if TYPE_CHECKING:
     from .menu import QualiaInteractiveMenu
 
+# diretório absoluto → (mtime_ns do diretório, {path: (tamanho, mtime)})
+JsonIndex = Dict[str, Tuple[int, Dict[str, Tuple[int, float]]]]
 
-def execute_analysis(menu: 'QualiaInteractiveMenu', file_path: str, analyzer: str, params: dict, output: str):
-    """Executa análise com feedback visual"""
+
+def execute_analysis(menu: 'QualiaInteractiveMenu', file_path: str, analyzer: str, params: dict,
+                     output: Union[str, Path]) -> bool:
+    """Executa análise com feedback visual. Retorna True se a análise gerou o arquivo."""
     # Late imports to use the same names the tests patch on handlers module
-    from qualia.cli.interactive.handlers import run_qualia_command, show_file_preview
+    from qualia.cli.interactive.handlers import run_qualia_inprocess, show_file_preview
 
     console.print(f"\n{format_success('Executando análise...')}")
 
     # Garantir diretório
     output_path = Path(output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_str = str(output_path)
 
     # Montar comando
-    args = ["analyze", file_path, "-p", analyzer, "-o", str(output_path)]
+    args = ["analyze", file_path, "-p", analyzer, "-o", output_str]
     for key, value in params.items():
         args.extend(["-P", f"{key}={value}"])
 
     # Executar
-    with console.status("[bold cyan]Analisando...[/bold cyan]"):
-        success, stdout, stderr = run_qualia_command(args)
+    # Saída vai pro terminal enquanto roda — o progresso é o do próprio comando
+    success, _, stderr = run_qualia_inprocess(args, stream=True)
 
     if success:
         console.print(format_success("Análise concluída!"))
-        console.print(stdout)
-        menu.current_analysis = str(output_path)
-        show_file_preview(str(output_path))
+        menu.current_analysis = output_str
+        show_file_preview(output_str)
     else:
         console.print(format_error(Exception("Erro na análise")))
         console.print(stderr)
+    return success
 
 
 def execute_visualization(data_file: str, visualizer: str, output: str, params: dict,
                           open_file_fn=None):
     """Executa visualização"""
     # Late imports to use the same names the tests patch on handlers module
-    from qualia.cli.interactive.handlers import run_qualia_command, Confirm
+    from qualia.cli.interactive.handlers import run_qualia_inprocess, Confirm
     from .services import open_file as _default_open_file
 
     if open_file_fn is None:
@@ -60,12 +66,11 @@ def execute_visualization(data_file: str, visualizer: str, output: str, params:
     for key, value in params.items():
         args.extend(["-P", f"{key}={value}"])
 
-    with console.status("[bold cyan]Visualizando...[/bold cyan]"):
-        success, stdout, stderr = run_qualia_command(args)
+    # Saída vai pro terminal enquanto roda — o progresso é o do próprio comando
+    success, _, stderr = run_qualia_inprocess(args, stream=True)
 
     if success:
         console.print(format_success("Visualização criada!"))
-        console.print(stdout)
 
         if output_path.exists() and Confirm.ask("\nAbrir arquivo?"):
             open_file_fn(str(output_path))
@@ -74,14 +79,14 @@ def execute_visualization(data_file: str, visualizer: str, output: str, params:
         console.print(stderr)
 
 
-def execute_pipeline(menu: 'QualiaInteractiveMenu', pipeline_path: Path):
-    """Executa um pipeline"""
+def execute_pipeline(menu: 'QualiaInteractiveMenu', pipeline_path: Path) -> Optional[Path]:
+    """Executa um pipeline. Retorna o diretório de saída se rodou com sucesso."""
     # Late imports to use the same names the tests patch on handlers module
-    from qualia.cli.interactive.handlers import choose_file, run_qualia_command, Prompt
+    from qualia.cli.interactive.handlers import choose_file, run_qualia_inprocess, Prompt
 
     file_path = choose_file(menu.recent_files)
     if not file_path:
-        return
+        return None
 
     menu.add_recent_file(file_path)
 
@@ -90,31 +95,68 @@ def execute_pipeline(menu: 'QualiaInteractiveMenu', pipeline_path: Path):
 
     args = ["pipeline", file_path, "-c", str(pipeline_path), "-o", output_dir]
 
-    with console.status("[bold cyan]Executando pipeline...[/bold cyan]"):
-        success, stdout, stderr = run_qualia_command(args)
+    # Saída vai pro terminal enquanto roda — o progresso é o do próprio comando
+    success, _, stderr = run_qualia_inprocess(args, stream=True)
 
     if success:
         console.print(format_success("Pipeline executado!"))
-        console.print(stdout)
-        show_generated_files(Path(output_dir))
-    else:
-        console.print(format_error(Exception("Erro no pipeline")))
-        console.print(stderr)
-
-
-def choose_data_file(menu: 'QualiaInteractiveMenu') -> Optional[str]:
-    """Escolhe arquivo de dados JSON"""
+        output_path = Path(output_dir)
+        show_generated_files(output_path)
+        return output_path
+    console.print(format_error(Exception("Erro no pipeline")))
+    console.print(stderr)
+    return None
+
+
+def _scan_json_dir(dir_path: str) -> Dict[str, Tuple[int, float]]:
+    """path → (tamanho, mtime) dos .json do diretório.
+
+    Um scandir só: nome, tamanho e mtime saem da própria listagem
+    (DirEntry.stat() é cacheado) — sem glob + dois stat() por arquivo.
+    """
+    rows = {}
+    with os.scandir(dir_path) as it:
+        for entry in it:
+            if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False):
+                st = entry.stat(follow_symlinks=False)
+                rows[entry.path] = (st.st_size, st.st_mtime)
+    return rows
+
+
+def _cached_json_dir(dir_path: str, json_index: JsonIndex) -> Dict[str, Tuple[int, float]]:
+    """Listagem do índice enquanto o mtime do diretório não muda.
+
+    Arquivo criado/removido muda o mtime do diretório e força novo scandir;
+    sobrescritas feitas pelo menu invalidam a entrada explicitamente.
+    """
+    key = os.path.abspath(dir_path)
+    dir_mtime = os.stat(key).st_mtime_ns
+    cached = json_index.get(key)
+    if cached is not None and cached[0] == dir_mtime:
+        return cached[1]
+    rows = _scan_json_dir(dir_path)
+    json_index[key] = (dir_mtime, rows)
+    return rows
+
+
+def choose_data_file(menu: 'QualiaInteractiveMenu',
+                     json_index: Optional[JsonIndex] = None) -> Optional[str]:
+    """Escolhe arquivo de dados JSON (json_index: cache de listagens entre chamadas)"""
     # Late imports to use the same names the tests patch on handlers module
     from qualia.cli.interactive.handlers import get_int_choice, Confirm, Prompt
 
-    search_dirs = [Path("."), Path("results")]
-    json_files = []
+    search_dirs = (".", "results")
+    # Dict pelo path dedupa sem precisar de set()
+    json_files = {}
 
     for dir_path in search_dirs:
-        if dir_path.exists():
-            json_files.extend(list(dir_path.glob("*.json")))
-
-    json_files = list(set(json_files))
+        try:
+            if json_index is None:
+                json_files.update(_scan_json_dir(dir_path))
+            else:
+                json_files.update(_cached_json_dir(dir_path, json_index))
+        except OSError:
+            continue
 
     if menu.current_analysis:
         console.print(f"\n[dim]Análise atual: {menu.current_analysis}[/dim]")
@@ -127,18 +169,17 @@ def choose_data_file(menu: 'QualiaInteractiveMenu') -> Optional[str]:
         return path if Path(path).exists() else None
 
     console.print("\n[bold]Arquivos de dados disponíveis:[/bold]")
-    json_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+    listed = sorted(json_files.items(), key=lambda kv: kv[1][1], reverse=True)[:10]
 
-    for i, f in enumerate(json_files[:10], 1):
-        size = f.stat().st_size / 1024
-        console.print(f"{i}. {f.name} [dim]({size:.1f} KB)[/dim]")
+    for i, (path, (size, _)) in enumerate(listed, 1):
+        console.print(f"{i}. {os.path.basename(path)} [dim]({size / 1024:.1f} KB)[/dim]")
 
-    console.print(f"{len(json_files[:10])+1}. Digitar caminho")
+    console.print(f"{len(listed)+1}. Digitar caminho")
 
-    choice = get_int_choice("Escolha", 1, min(10, len(json_files)) + 1)
+    choice = get_int_choice("Escolha", 1, len(listed) + 1)
 
-    if choice <= len(json_files[:10]):
-        return str(json_files[choice-1])
+    if choice <= len(listed):
+        return os.path.normpath(listed[choice-1][0])
 
     path = Prompt.ask("Caminho do arquivo JSON")
     return path if Path(path).exists() and path.endswith('.json') else None
@@ -146,10 +187,13 @@ def choose_data_file(menu: 'QualiaInteractiveMenu') -> Optional[str]:
 
 def show_generated_files(output_dir: Path):
     """Mostra arquivos gerados"""
-    if output_dir.exists():
-        files = list(output_dir.glob("*"))
-        if files:
-            console.print("\n[bold]Arquivos gerados:[/bold]")
-            for f in files:
-                size = f.stat().st_size / 1024
-                console.print(f"  • {f.name} ({size:.1f} KB)")
+    # Tamanho do DirEntry (stat cacheado da listagem) e um print só pro bloco
+    try:
+        with os.scandir(output_dir) as it:
+            files = [(e.name, e.stat().st_size) for e in it if e.is_file()]
+    except OSError:
+        return
+    if files:
+        console.print("\n[bold]Arquivos gerados:[/bold]\n" + "\n".join(
+            f"  • {name} ({size / 1024:.1f} KB)" for name, size in files
+        ))
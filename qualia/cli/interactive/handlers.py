@@ -2,14 +2,16 @@
 Handlers para os comandos do menu interativo
 """
 
+import os
 from pathlib import Path
-from typing import Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, Union, TYPE_CHECKING
 from rich.prompt import Prompt, Confirm
 
 from ..formatters import console, format_success, format_error, format_warning
 from .utils import (
     choose_file, choose_plugin, configure_parameters,
-    run_qualia_command, get_int_choice, show_file_preview
+    run_qualia_command, run_qualia_command_streaming, run_qualia_inprocess,
+    get_int_choice, show_file_preview
 )
 from .wizards import PipelineWizard
 from .services import (
@@ -18,19 +20,71 @@ from .services import (
 )
 from .actions import (
     execute_analysis, execute_visualization, execute_pipeline,
-    choose_data_file, show_generated_files
+    choose_data_file, show_generated_files, JsonIndex
 )
 
 if TYPE_CHECKING:
     from .menu import QualiaInteractiveMenu
 
 
+# Tabelas de opções fixas — montadas uma vez no import, não a cada tela
+_VIZ_FORMATS = {
+    "1": ("png", "Imagem PNG"),
+    "2": ("html", "HTML interativo"),
+    "3": ("svg", "Imagem vetorial SVG")
+}
+_VIZ_FORMAT_CHOICES = list(_VIZ_FORMATS)
+_VIZ_FORMATS_TEXT = "\n[bold]Formato de saída:[/bold]\n" + "\n".join(
+    f"{key}. {desc}" for key, (_, desc) in _VIZ_FORMATS.items()
+)
+
+_EXPORT_FORMATS = {
+    "1": ("csv", "CSV"),
+    "2": ("excel", "Excel"),
+    "3": ("markdown", "Markdown"),
+    "4": ("html", "HTML"),
+    "5": ("yaml", "YAML")
+}
+_EXPORT_FORMAT_CHOICES = list(_EXPORT_FORMATS)
+_EXPORT_FORMATS_TEXT = "[bold]Formato de saída:[/bold]\n" + "\n".join(
+    f"{key}. {desc}" for key, (_, desc) in _EXPORT_FORMATS.items()
+)
+
+# (tecla, texto, método do MenuHandlers) — None volta pro menu
+_SETTINGS_LAYOUT = (
+    ("1", "Limpar cache", "_clear_cache"),
+    ("2", "Ver configuração atual", "_show_config"),
+    ("3", "Instalar dependências de plugin", "_install_dependencies"),
+    ("4", "Verificar instalação", "_verify_installation"),
+    ("5", "Voltar", None),
+)
+_SETTINGS_TEXT = "\n".join(f"{key}. {text}" for key, text, _ in _SETTINGS_LAYOUT)
+_SETTINGS_CHOICES = [key for key, _, _ in _SETTINGS_LAYOUT]
+_SETTINGS_TARGETS = {key: method for key, _, method in _SETTINGS_LAYOUT if method}
+
+
 class MenuHandlers:
     """Handlers para as opções do menu"""
 
     def __init__(self, menu: 'QualiaInteractiveMenu'):
         self.menu = menu
         self.pipeline_wizard = PipelineWizard()
+        # Saída de subcomandos só-leitura (list/inspect) por argv — evita
+        # re-renderizar a listagem a cada visita à tela de plugins
+        self._cmd_cache: Dict[Tuple[str, ...], Tuple[bool, str, str]] = {}
+        # Listagens de .json reaproveitadas entre visitas à escolha de dados
+        self._json_index: JsonIndex = {}
+
+    def _cached_qualia(self, args: List[str]) -> Tuple[bool, str, str]:
+        """run_qualia_inprocess memoizado — só guarda execuções bem-sucedidas."""
+        key = tuple(args)
+        cached = self._cmd_cache.get(key)
+        if cached is not None:
+            return cached
+        result = run_qualia_inprocess(args)
+        if result[0]:
+            self._cmd_cache[key] = result
+        return result
 
     def analyze_document(self):
         """Handler para análise de documentos"""
@@ -58,11 +112,11 @@ class MenuHandlers:
             default=f"{Path(file_path).stem}_analysis.json"
         )
 
-        # Executar análise
-        self._execute_analysis(file_path, analyzer, params, output_name)
+        # Executar análise — o retorno já diz se o arquivo foi gerado, sem novo stat
+        analyzed = self._execute_analysis(file_path, analyzer, params, Path(output_name))
 
         # Oferecer visualização
-        if Path(output_name).exists() and Confirm.ask("\nDeseja visualizar os resultados?"):
+        if analyzed and Confirm.ask("\nDeseja visualizar os resultados?"):
             self.visualize_results(output_name)
 
         Prompt.ask("\nPressione Enter para voltar ao menu")
@@ -87,18 +141,10 @@ class MenuHandlers:
             return
 
         # Configurar formato de saída
-        formats = {
-            "1": ("png", "Imagem PNG"),
-            "2": ("html", "HTML interativo"),
-            "3": ("svg", "Imagem vetorial SVG")
-        }
+        console.print(_VIZ_FORMATS_TEXT)
 
-        console.print("\n[bold]Formato de saída:[/bold]")
-        for key, (ext, desc) in formats.items():
-            console.print(f"{key}. {desc}")
-
-        format_choice = Prompt.ask("Escolha", choices=list(formats.keys()))
-        format_ext = formats[format_choice][0]
+        format_choice = Prompt.ask("Escolha", choices=_VIZ_FORMAT_CHOICES)
+        format_ext = _VIZ_FORMATS[format_choice][0]
 
         # Nome do arquivo
         output_name = Prompt.ask(
@@ -158,7 +204,7 @@ class MenuHandlers:
         console.print("\n[bold]EXPLORAR PLUGINS[/bold]\n")
 
         # Mostrar todos os plugins
-        success, output, error = run_qualia_command(["list", "-d"])
+        success, output, error = self._cached_qualia(["list", "-d"])
 
         if success:
             console.print(output)
@@ -170,7 +216,7 @@ class MenuHandlers:
         plugin_id = Prompt.ask("Plugin ID (ou Enter para voltar)", default="")
 
         if plugin_id:
-            success, output, error = run_qualia_command(["inspect", plugin_id])
+            success, output, error = self._cached_qualia(["inspect", plugin_id])
 
             if success:
                 console.print("\n" + output)
@@ -184,39 +230,40 @@ class MenuHandlers:
         self.menu.show_banner()
         console.print("\n[bold]CONFIGURAÇÕES[/bold]\n")
 
-        options = {
-            "1": ("Limpar cache", self._clear_cache),
-            "2": ("Ver configuração atual", self._show_config),
-            "3": ("Instalar dependências de plugin", self._install_dependencies),
-            "4": ("Verificar instalação", self._verify_installation),
-            "5": ("Voltar", None)
-        }
-
-        for key, (text, _) in options.items():
-            console.print(f"{key}. {text}")
+        console.print(_SETTINGS_TEXT)
 
-        choice = Prompt.ask("Opção", choices=list(options.keys()))
+        choice = Prompt.ask("Opção", choices=_SETTINGS_CHOICES)
 
-        if choice != "5" and choice in options:
-            _, handler = options[choice]
-            if handler:
-                handler()
-                Prompt.ask("\nPressione Enter para continuar")
+        method = _SETTINGS_TARGETS.get(choice)
+        if method:
+            getattr(self, method)()
+            Prompt.ask("\nPressione Enter para continuar")
 
     # --- Thin wrappers delegating to actions module ---
 
-    def _execute_analysis(self, file_path: str, analyzer: str, params: dict, output: str):
-        return execute_analysis(self.menu, file_path, analyzer, params, output)
+    def _execute_analysis(self, file_path: str, analyzer: str, params: dict,
+                          output: Union[str, Path]) -> bool:
+        success = execute_analysis(self.menu, file_path, analyzer, params, output)
+        if success:
+            # Sobrescrever um .json não muda o mtime do diretório — invalida na mão
+            self._invalidate_json_index(Path(output).parent)
+        return success
 
     def _execute_visualization(self, data_file: str, visualizer: str, output: str, params: dict):
         return execute_visualization(data_file, visualizer, output, params,
                                      open_file_fn=self._open_file)
 
-    def _execute_pipeline(self, pipeline_path: Path):
-        return execute_pipeline(self.menu, pipeline_path)
+    def _execute_pipeline(self, pipeline_path: Path) -> Optional[Path]:
+        output_dir = execute_pipeline(self.menu, pipeline_path)
+        if output_dir is not None:
+            self._invalidate_json_index(output_dir)
+        return output_dir
 
     def _choose_data_file(self) -> Optional[str]:
-        return choose_data_file(self.menu)
+        return choose_data_file(self.menu, self._json_index)
+
+    def _invalidate_json_index(self, dir_path: Union[str, Path]):
+        self._json_index.pop(os.path.abspath(dir_path), None)
 
     def _show_generated_files(self, output_dir: Path):
         return show_generated_files(output_dir)
@@ -224,12 +271,15 @@ class MenuHandlers:
     # --- Thin wrappers delegating to services module ---
 
     def _clear_cache(self):
+        self._cmd_cache.clear()
         return clear_cache()
 
     def _show_config(self):
         return show_config()
 
     def _install_dependencies(self):
+        # Plugins novos/atualizados mudam a saída de list/inspect
+        self._cmd_cache.clear()
         return install_dependencies()
 
     def _verify_installation(self):
@@ -262,7 +312,7 @@ class MenuHandlers:
             args.extend(["-P", f"{key}={value}"])
 
         with console.status("[bold cyan]Processando...[/bold cyan]"):
-            success, stdout, stderr = run_qualia_command(args)
+            success, stdout, stderr = run_qualia_inprocess(args)
 
         if success:
             console.print(format_success("Documento processado!"))
@@ -296,7 +346,7 @@ class MenuHandlers:
             args.append("--continue-on-error")
 
         with console.status("[bold cyan]Processando arquivos...[/bold cyan]"):
-            success, stdout, stderr = run_qualia_command(args)
+            success, stdout, stderr = run_qualia_inprocess(args)
 
         if success:
             console.print(format_success("Batch concluído!"))
@@ -330,12 +380,11 @@ class MenuHandlers:
         console.print(format_success(f"Monitorando {folder} com {plugin}..."))
         console.print("[dim]Pressione Ctrl+C para parar[/dim]\n")
 
-        success, stdout, stderr = run_qualia_command(args)
-
-        if success:
-            console.print(stdout)
-        else:
-            console.print(stderr)
+        # Watch roda até Ctrl+C — fica em processo separado, com a saída
+        # repassada linha a linha em vez de aparecer só no fim
+        run_qualia_command_streaming(
+            args, lambda line: console.print(line, markup=False, highlight=False)
+        )
 
         Prompt.ask("\nPressione Enter para voltar ao menu")
 
@@ -348,20 +397,10 @@ class MenuHandlers:
         if not input_file:
             return
 
-        formats = {
-            "1": ("csv", "CSV"),
-            "2": ("excel", "Excel"),
-            "3": ("markdown", "Markdown"),
-            "4": ("html", "HTML"),
-            "5": ("yaml", "YAML")
-        }
-
-        console.print("[bold]Formato de saída:[/bold]")
-        for key, (_, desc) in formats.items():
-            console.print(f"{key}. {desc}")
+        console.print(_EXPORT_FORMATS_TEXT)
 
-        choice = Prompt.ask("Escolha", choices=list(formats.keys()))
-        fmt, _ = formats[choice]
+        choice = Prompt.ask("Escolha", choices=_EXPORT_FORMAT_CHOICES)
+        fmt, _ = _EXPORT_FORMATS[choice]
 
         default_output = f"{Path(input_file).stem}.{fmt}"
         output = Prompt.ask("Arquivo de saída", default=default_output)
@@ -369,7 +408,7 @@ class MenuHandlers:
         args = ["export", input_file, "-f", fmt, "-o", output]
 
         with console.status("[bold cyan]Exportando...[/bold cyan]"):
-            success, stdout, stderr = run_qualia_command(args)
+            success, stdout, stderr = run_qualia_inprocess(args)
 
         if success:
             console.print(format_success(f"Exportado para {output}"))
@@ -2,26 +2,49 @@
 Menu principal do Qualia Interactive
 """
 
-import os
-from typing import Optional
+from collections import deque
+from itertools import islice
+from typing import Deque, Optional, Set
 from rich.prompt import Prompt
 from ..formatters import console, show_banner
 from .handlers import MenuHandlers
 from .tutorials import TutorialManager
 
 
+# (tecla, ícone, texto, atributo dono, método) — montado uma vez no import,
+# o loop só resolve o handler escolhido
+_MAIN_MENU_LAYOUT = (
+    ("1", "📄", "Analisar documento", "handlers", "analyze_document"),
+    ("2", "🧹", "Processar documento", "handlers", "process_document"),
+    ("3", "🎨", "Visualizar resultados", "handlers", "visualize_results"),
+    ("4", "🔄", "Executar pipeline", "handlers", "run_pipeline"),
+    ("5", "📦", "Batch (múltiplos arquivos)", "handlers", "batch_process"),
+    ("6", "👁️", "Watch (monitorar pasta)", "handlers", "watch_folder"),
+    ("7", "📤", "Exportar resultados", "handlers", "export_results"),
+    ("8", "🔍", "Explorar plugins", "handlers", "explore_plugins"),
+    ("9", "⚙️", "Configurações", "handlers", "settings_menu"),
+    ("10", "📚", "Exemplos e tutoriais", "tutorials", "show_menu"),
+    ("0", "❌", "Sair", None, None),
+)
+_MAIN_MENU_TEXT = "\n[bold]MENU PRINCIPAL[/bold]\n\n" + "\n".join(f"{key}. {icon} {text}" for key, icon, text, _, _ in _MAIN_MENU_LAYOUT)
+_MAIN_MENU_CHOICES = [key for key, *_ in _MAIN_MENU_LAYOUT]
+_MAIN_MENU_TARGETS = {key: (owner, method) for key, _, _, owner, method in _MAIN_MENU_LAYOUT if owner}
+
+
 class QualiaInteractiveMenu:
     """Menu interativo principal do Qualia"""
     
     def __init__(self):
         self.current_analysis = None
-        self.recent_files = []
+        # Últimos 10 em ordem de uso + set pra checar pertinência em O(1)
+        self.recent_files: Deque[str] = deque(maxlen=10)
+        self._recent_set: Set[str] = set()
         self.handlers = MenuHandlers(self)
-        self.tutorials = TutorialManager()
+        self.tutorials = TutorialManager(self)
     
     def clear_screen(self):
-        """Limpa a tela do terminal"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        """Limpa a tela do terminal — sequência ANSI via Rich, sem subir shell"""
+        console.clear()
     
     def show_banner(self):
         """Exibe o banner do Qualia"""
@@ -34,49 +57,35 @@ class QualiaInteractiveMenu:
             self.show_banner()
             self._show_recent_files()
             
-            console.print("\n[bold]MENU PRINCIPAL[/bold]\n")
-            
-            options = {
-                "1": ("📄", "Analisar documento", self.handlers.analyze_document),
-                "2": ("🧹", "Processar documento", self.handlers.process_document),
-                "3": ("🎨", "Visualizar resultados", self.handlers.visualize_results),
-                "4": ("🔄", "Executar pipeline", self.handlers.run_pipeline),
-                "5": ("📦", "Batch (múltiplos arquivos)", self.handlers.batch_process),
-                "6": ("👁️", "Watch (monitorar pasta)", self.handlers.watch_folder),
-                "7": ("📤", "Exportar resultados", self.handlers.export_results),
-                "8": ("🔍", "Explorar plugins", self.handlers.explore_plugins),
-                "9": ("⚙️", "Configurações", self.handlers.settings_menu),
-                "10": ("📚", "Exemplos e tutoriais", self.tutorials.show_menu),
-                "0": ("❌", "Sair", None)
-            }
-            
-            for key, (icon, text, _) in options.items():
-                console.print(f"{key}. {icon} {text}")
-            
+            console.print(_MAIN_MENU_TEXT)
+
             choice = Prompt.ask(
                 "\n[bold cyan]Escolha uma opção[/bold cyan]", 
-                choices=list(options.keys())
+                choices=_MAIN_MENU_CHOICES
             )
             
             if choice == "0":
                 console.print("\n[bold green]Até logo! 👋[/bold green]")
                 break
             
-            if choice in options:
-                _, _, handler = options[choice]
-                if handler:
-                    handler()
+            target = _MAIN_MENU_TARGETS.get(choice)
+            if target:
+                owner, method = target
+                getattr(getattr(self, owner), method)()
     
     def _show_recent_files(self):
         """Mostra arquivos recentes se houver"""
         if self.recent_files:
             console.print("\n[dim]Arquivos recentes:[/dim]")
-            for f in self.recent_files[-3:]:
+            for f in islice(self.recent_files, max(len(self.recent_files) - 3, 0), None):
                 console.print(f"  • {f}")
     
     def add_recent_file(self, filepath: str):
-        """Adiciona arquivo à lista de recentes"""
-        if filepath not in self.recent_files:
-            self.recent_files.append(filepath)
-            # Manter apenas os últimos 10
-            self.recent_files = self.recent_files[-10:]
\ No newline at end of file
+        """Adiciona arquivo à lista de recentes (reusar move pro fim)"""
+        if filepath in self._recent_set:
+            self.recent_files.remove(filepath)
+        elif len(self.recent_files) == self.recent_files.maxlen:
+            # O append vai descartar o mais antigo — tira do set também
+            self._recent_set.discard(self.recent_files[0])
+        self.recent_files.append(filepath)
+        self._recent_set.add(filepath)
@@ -2,23 +2,31 @@
 Serviços utilitários extraídos de MenuHandlers — funções que não dependem de estado.
 """
 
+import importlib.util
+import os
 import sys
-import shutil
 from pathlib import Path
 
 from ..formatters import console, format_success, format_warning, format_error
 
+# Dependências listadas em "Ver configuração atual"
+_MAIN_DEPS = ("click", "rich", "nltk", "matplotlib", "wordcloud", "plotly")
+
 
 def clear_cache():
     """Limpa o cache — usa o cache_dir real do core, não path relativo ao cwd."""
     # Late import to use the same name the tests patch on handlers module
     from qualia.cli.interactive.handlers import Confirm
     if Confirm.ask("Limpar todo o cache?"):
+        import shutil
         from qualia.cli.commands.utils import get_core
-        cache_dir = get_core().cache.cache_dir
+        cache = get_core().cache
+        cache_dir = cache.cache_dir
         if cache_dir.exists():
             shutil.rmtree(cache_dir)
             cache_dir.mkdir()
+            # Zera também o tracking e a camada em memória do core em processo
+            cache.clear()
             console.print(format_success("Cache limpo!"))
         else:
             console.print(format_warning("Diretório de cache não encontrado"))
@@ -39,14 +47,20 @@ def show_config():
 
     console.print(f"Plugins instalados: {plugin_count}")
 
-    console.print("\n[bold]Dependências principais:[/bold]")
-    deps = ["click", "rich", "nltk", "matplotlib", "wordcloud", "plotly"]
-    for dep in deps:
+    import importlib.metadata
+    # find_spec/metadata só olham o sys.path e o dist-info — não executam o
+    # import de matplotlib/plotly só pra marcar um check
+    lines = ["\n[bold]Dependências principais:[/bold]"]
+    for dep in _MAIN_DEPS:
+        # Já carregado no processo (click/rich sempre estão) — nem precisa do find_spec
+        if dep not in sys.modules and importlib.util.find_spec(dep) is None:
+            lines.append(f"  ✗ {dep} [red](não instalado)[/red]")
+            continue
         try:
-            __import__(dep)
-            console.print(f"  ✓ {dep}")
-        except ImportError:
-            console.print(f"  ✗ {dep} [red](não instalado)[/red]")
+            lines.append(f"  ✓ {dep} [dim]{importlib.metadata.version(dep)}[/dim]")
+        except importlib.metadata.PackageNotFoundError:
+            lines.append(f"  ✓ {dep}")
+    console.print("\n".join(lines))
 
 
 def install_dependencies():
@@ -87,9 +101,12 @@ def verify_installation():
         console.print(format_error(Exception("Problema com comando qualia")))
 
     # Verificar estrutura (dirs reais do projeto, não stale)
+    # Um scandir do cwd em vez de um stat por diretório
+    with os.scandir(".") as it:
+        present = {e.name for e in it if e.is_dir()}
     required_dirs = ["qualia", "plugins", "cache"]
     for dir_name in required_dirs:
-        if Path(dir_name).exists():
+        if dir_name in present:
             console.print(format_success(f"Diretório {dir_name}"))
         else:
             console.print(format_warning(f"Diretório {dir_name} não encontrado"))
@@ -98,7 +115,6 @@ def verify_installation():
 def open_file(filepath: str):
     """Abre arquivo no sistema — sem shell=True pra evitar injeção de comando."""
     import subprocess
-    import os
     if sys.platform == "darwin":
         subprocess.run(["open", filepath])
     elif sys.platform == "linux":
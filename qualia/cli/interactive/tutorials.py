@@ -2,59 +2,57 @@
 Sistema de tutoriais do menu interativo
 """
 
+from typing import Optional, TYPE_CHECKING
 from rich.panel import Panel
 from rich.prompt import Prompt
-from ..formatters import console
+from ..formatters import console, show_banner
 from .utils import get_int_choice
 
+if TYPE_CHECKING:
+    from .menu import QualiaInteractiveMenu
+
+
+# (chave, título, método que monta o conteúdo) — tabela fixa, definida uma vez
+_TUTORIALS = (
+    ("basic_analysis", "Análise Básica de Texto", "_tutorial_basic_analysis"),
+    ("transcript_cleaning", "Limpeza de Transcrições", "_tutorial_transcript_cleaning"),
+    ("visualization", "Criação de Visualizações", "_tutorial_visualization"),
+    ("pipelines", "Pipelines Complexos", "_tutorial_pipelines"),
+    ("complete_flow", "Fluxo Completo de Análise", "_tutorial_complete_flow"),
+)
+_TUTORIALS_TEXT = "\n".join(
+    f"{i}. {title}" for i, (_, title, _) in enumerate(_TUTORIALS, 1)
+) + f"\n{len(_TUTORIALS) + 1}. Voltar"
+
 
 class TutorialManager:
     """Gerenciador de tutoriais"""
     
-    def __init__(self):
+    def __init__(self, menu: Optional['QualiaInteractiveMenu'] = None):
+        self._menu = menu
+        # Guarda só a referência do método — o texto é montado quando o tutorial é aberto
         self.tutorials = {
-            "basic_analysis": {
-                "title": "Análise Básica de Texto",
-                "content": self._tutorial_basic_analysis()
-            },
-            "transcript_cleaning": {
-                "title": "Limpeza de Transcrições",
-                "content": self._tutorial_transcript_cleaning()
-            },
-            "visualization": {
-                "title": "Criação de Visualizações",
-                "content": self._tutorial_visualization()
-            },
-            "pipelines": {
-                "title": "Pipelines Complexos",
-                "content": self._tutorial_pipelines()
-            },
-            "complete_flow": {
-                "title": "Fluxo Completo de Análise",
-                "content": self._tutorial_complete_flow()
-            }
+            key: {"title": title, "build": getattr(self, method)}
+            for key, title, method in _TUTORIALS
         }
     
     def show_menu(self):
         """Mostra menu de tutoriais"""
-        from .menu import QualiaInteractiveMenu
-        menu = QualiaInteractiveMenu()
-        menu.show_banner()
+        # Reusa o menu dono — sem ele, só imprime o banner (nada de montar outro menu)
+        if self._menu is not None:
+            self._menu.show_banner()
+        else:
+            console.print(show_banner())
         
         console.print("\n[bold]EXEMPLOS E TUTORIAIS[/bold]\n")
         
-        tutorial_list = list(self.tutorials.items())
-        
-        for i, (key, info) in enumerate(tutorial_list, 1):
-            console.print(f"{i}. {info['title']}")
-        
-        console.print(f"{len(tutorial_list)+1}. Voltar")
+        console.print(_TUTORIALS_TEXT)
         
-        choice = get_int_choice("Escolha", 1, len(tutorial_list)+1)
+        choice = get_int_choice("Escolha", 1, len(_TUTORIALS)+1)
         
-        if choice <= len(tutorial_list):
-            key, info = tutorial_list[choice-1]
-            self._show_tutorial(info['title'], info['content'])
+        if choice <= len(_TUTORIALS):
+            info = self.tutorials[_TUTORIALS[choice-1][0]]
+            self._show_tutorial(info['title'], info['build']())
     
     def _show_tutorial(self, title: str, content: str):
         """Exibe um tutorial"""
@@ -2,10 +2,10 @@
 Utilidades para o menu interativo
 """
 
+import os
 import subprocess
-import json
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Callable, List, Dict, Any, Optional, Sequence, Tuple
 from rich.prompt import Prompt, Confirm
 from ..formatters import console
 
@@ -32,7 +32,81 @@ def run_qualia_command(args: List[str]) -> Tuple[bool, str, str]:
     return result.returncode == 0, result.stdout, result.stderr
 
 
-def choose_file(recent_files: List[str]) -> Optional[str]:
+def run_qualia_command_streaming(args: List[str], on_line: Callable[[str], None]) -> bool:
+    """
+    Executa um comando qualia repassando cada linha de saída (stdout + stderr)
+    pra on_line assim que ela chega. Retorna True se o comando terminou com sucesso.
+    """
+    # -u: sem buffer no filho, senão as linhas só chegam em blocos de 8KB.
+    # stderr junto do stdout num pipe só — selectors não funciona com pipes no Windows
+    cmd = ["python", "-u", "-m", "qualia"] + args
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                            text=True, bufsize=1)
+    try:
+        try:
+            for line in proc.stdout:
+                on_line(line.rstrip("\n"))
+        except KeyboardInterrupt:
+            # O filho recebeu o mesmo SIGINT — repassa o que ele ainda imprime ao encerrar
+            for line in proc.stdout:
+                on_line(line.rstrip("\n"))
+        return proc.wait() == 0
+    finally:
+        proc.stdout.close()
+        if proc.poll() is None:  # interrompido (Ctrl+C) no meio da leitura
+            proc.kill()
+            proc.wait()
+
+
+def run_qualia_inprocess(args: List[str], stream: bool = False) -> Tuple[bool, str, str]:
+    """
+    Executa um comando qualia no próprio processo e retorna (sucesso, stdout, stderr).
+
+    Mesmo contrato de run_qualia_command, sem subir interpretador: reusa os
+    imports e o core (registry) já carregados pelo menu. A saída do console
+    dos comandos vai pra um buffer enquanto o comando roda — com stream=True
+    vai direto pro terminal (com o progresso do próprio comando) e stdout volta
+    vazio; em falha, stderr traz ao menos o comando e o código de saída.
+    """
+    import io
+    import sys
+    from contextlib import ExitStack, redirect_stderr, redirect_stdout
+    import click
+    from qualia.cli.commands import cli
+    from qualia.cli.commands import utils as cmd_utils
+
+    out, err = io.StringIO(), io.StringIO()
+    cmd_console = cmd_utils.console
+    try:
+        with ExitStack() as redirects:
+            redirects.enter_context(redirect_stderr(err))
+            if not stream:
+                # Console sem file próprio segue o sys.stdout, então o redirect
+                # já captura ele e o click.echo (list --json, help). Console com
+                # file configurado é apontado pro buffer e restaurado na saída
+                if cmd_console.file is not sys.stdout:
+                    redirects.callback(setattr, cmd_console, "file", cmd_console.file)
+                    cmd_console.file = out
+                redirects.enter_context(redirect_stdout(out))
+            rv = cli.main(args=list(args), prog_name="qualia", standalone_mode=False)
+        code = rv if isinstance(rv, int) else 0
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except click.ClickException as e:
+        e.show(file=err)
+        code = e.exit_code
+    except click.Abort:
+        code = 1
+    except Exception as e:
+        err.write(f"{type(e).__name__}: {e}\n")
+        code = 1
+    if stream and code != 0 and not err.getvalue():
+        # Com stream o comando já imprimiu o erro no terminal — stderr não volta vazio
+        err.write(f"'qualia {' '.join(args)}' terminou com código {code} (detalhes acima)\n")
+    return code == 0, out.getvalue(), err.getvalue()
+
+
+def choose_file(recent_files: Sequence[str]) -> Optional[str]:
     """Interface para escolher arquivo"""
     console.print("\n[bold]Escolher arquivo:[/bold]")
     
@@ -63,42 +137,64 @@ def _choose_file_by_path() -> Optional[str]:
         return None
 
 
+# Diretórios onde procurar exemplos, em ordem de exibição
+_EXAMPLE_DIRS = ("examples", "docs/examples", ".")
+
+# diretório real → (mtime_ns do diretório, nomes dos .txt). Listagem só
+# muda quando arquivos são criados/removidos, o que muda o mtime do diretório
+_EXAMPLES_CACHE: Dict[str, Tuple[int, List[str]]] = {}
+
+
+def _example_files(dir_path: str, key: str) -> List[str]:
+    """Nomes dos .txt do diretório — do cache enquanto o mtime não muda."""
+    mtime = os.stat(key).st_mtime_ns
+    cached = _EXAMPLES_CACHE.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    # scandir + sufixo: sem fnmatch nem Path por entrada, is_file vem da listagem
+    with os.scandir(dir_path) as it:
+        names = [e.name for e in it
+                 if e.name.endswith(".txt") and e.is_file(follow_symlinks=False)]
+    _EXAMPLES_CACHE[key] = (mtime, names)
+    return names
+
+
 def _choose_file_from_examples() -> Optional[str]:
     """Escolhe arquivo dos exemplos"""
-    possible_dirs = [
-        Path("examples"),
-        Path("docs/examples"),
-        Path(".")
-    ]
-    
-    all_files = []
-    for dir_path in possible_dirs:
-        if dir_path.exists():
-            txt_files = list(dir_path.glob("*.txt"))
-            for f in txt_files:
-                if f not in all_files:
-                    all_files.append(f)
+    all_files = []  # (diretório, nome)
+    seen_dirs = set()
+    for dir_path in _EXAMPLE_DIRS:
+        try:
+            # Dedup por diretório real (symlink pra mesma pasta) em vez de
+            # procurar cada arquivo na lista
+            real = os.path.realpath(dir_path)
+            if real in seen_dirs:
+                continue
+            all_files.extend((dir_path, name) for name in _example_files(dir_path, real))
+            seen_dirs.add(real)
+        except OSError:
+            continue
     
     if not all_files:
         console.print("[yellow]Nenhum arquivo de exemplo encontrado![/yellow]")
         return None
     
     console.print("\n[bold]Arquivos de exemplo:[/bold]")
-    for i, f in enumerate(all_files, 1):
-        console.print(f"{i}. {f.name} [dim]({f.parent})[/dim]")
+    for i, (dir_path, name) in enumerate(all_files, 1):
+        console.print(f"{i}. {name} [dim]({dir_path})[/dim]")
     
     idx = get_int_choice("Escolha", 1, len(all_files))
-    return str(all_files[idx-1])
+    return os.path.normpath(os.path.join(*all_files[idx-1]))
 
 
-def _choose_file_from_recent(recent_files: List[str]) -> Optional[str]:
+def _choose_file_from_recent(recent_files: Sequence[str]) -> Optional[str]:
     """Escolhe arquivo dos recentes"""
     if not recent_files:
         console.print("[yellow]Nenhum arquivo recente![/yellow]")
         return None
     
     console.print("\n[bold]Arquivos recentes:[/bold]")
-    recent = recent_files[-5:]
+    recent = list(recent_files)[-5:]  # deque não fatia
     for i, f in enumerate(recent, 1):
         console.print(f"{i}. {f}")
 
@@ -118,25 +214,28 @@ def choose_plugin(plugin_type: str = "all") -> Optional[str]:
         return None
 
     if plugin_type == "all":
-        plugin_list = list(core.registry.values())
+        plugin_list = sorted(core.registry.values(), key=lambda p: p.id)
     else:
         try:
             pt = PluginType(plugin_type)
         except ValueError:
             console.print(f"[red]Tipo desconhecido: {plugin_type}[/red]")
             return None
-        plugin_list = [p for p in core.registry.values() if p.type == pt]
+        plugin_list = sorted((p for p in core.registry.values() if p.type == pt),
+                             key=lambda p: p.id)
 
     if not plugin_list:
         console.print(f"[red]Nenhum {plugin_type} encontrado![/red]")
         return None
 
-    console.print(f"\n[bold]Escolha um {plugin_type}:[/bold]")
-    for i, meta in enumerate(sorted(plugin_list, key=lambda p: p.id), 1):
-        console.print(f"{i}. [cyan]{meta.id}[/cyan] - {meta.name} [dim]({meta.type.value})[/dim]")
+    # Ordena uma vez — a mesma lista serve pra exibir e pra resolver a escolha
+    console.print(f"\n[bold]Escolha um {plugin_type}:[/bold]\n" + "\n".join(
+        f"{i}. [cyan]{meta.id}[/cyan] - {meta.name} [dim]({meta.type.value})[/dim]"
+        for i, meta in enumerate(plugin_list, 1)
+    ))
 
     idx = get_int_choice("Escolha", 1, len(plugin_list))
-    return sorted(plugin_list, key=lambda p: p.id)[idx - 1].id
+    return plugin_list[idx - 1].id
 
 
 def configure_parameters(plugin: str, context: str = "general") -> Dict[str, str]:
@@ -176,23 +275,48 @@ def configure_parameters(plugin: str, context: str = "general") -> Dict[str, str
     return params
 
 
+# Preview de JSON só parseia arquivos até este tamanho — resultados comuns
+# cabem folgado; JSON de GB não é carregado inteiro só pra listar 3 chaves
+_JSON_PREVIEW_BYTES = 1 << 20
+_COUNT_CHUNK = 1 << 20
+
+
 def show_file_preview(filepath: str, max_lines: int = 5):
     """Mostra preview de um arquivo"""
     try:
         path = Path(filepath)
         if path.suffix == '.json':
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            import json
+            with open(path, 'rb') as f:
+                raw = f.read(_JSON_PREVIEW_BYTES + 1)
             console.print("\n[bold]Preview do JSON:[/bold]")
+            if len(raw) > _JSON_PREVIEW_BYTES:
+                size_mb = path.stat().st_size / 1024 / 1024
+                console.print(f"  [dim]Arquivo grande ({size_mb:.1f} MB) — chaves omitidas[/dim]")
+                return
+            data = json.loads(raw)
             for key in list(data.keys())[:3]:
                 console.print(f"  • {key}: {type(data[key]).__name__}")
         else:
-            with open(path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            console.print(f"\n[bold]Preview ({len(lines)} linhas total):[/bold]")
-            for line in lines[:max_lines]:
+            # Lê só as linhas exibidas; o resto é contado em blocos binários,
+            # sem manter o arquivo em memória
+            preview = []
+            rest = 0
+            with open(path, 'rb') as f:
+                for line in f:
+                    preview.append(line.decode('utf-8'))
+                    if len(preview) == max_lines:
+                        break
+                last = b"\n"
+                for chunk in iter(lambda: f.read(_COUNT_CHUNK), b""):
+                    rest += chunk.count(b"\n")
+                    last = chunk[-1:]
+                if last != b"\n":
+                    rest += 1  # última linha sem quebra
+            console.print(f"\n[bold]Preview ({len(preview) + rest} linhas total):[/bold]")
+            for line in preview:
                 console.print(f"  {line.rstrip()}")
-            if len(lines) > max_lines:
-                console.print(f"  [dim]... mais {len(lines) - max_lines} linhas[/dim]")
+            if rest:
+                console.print(f"  [dim]... mais {rest} linhas[/dim]")
     except Exception as e:
         console.print(f"[yellow]Não foi possível fazer preview: {e}[/yellow]")
\ No newline at end of file
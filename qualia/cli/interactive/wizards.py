@@ -2,7 +2,6 @@
 Wizards (assistentes) para criação guiada
 """
 
-import yaml
 from pathlib import Path
 from typing import List, Dict, Any
 from rich.prompt import Prompt, Confirm
@@ -139,6 +138,9 @@ class PipelineWizard:
     
     def _save_pipeline(self, name: str, data: Dict[str, Any]):
         """Salva o pipeline em arquivo YAML"""
+        import yaml
+        # Emissor em C (libyaml) quando disponível; SafeDumper puro como fallback
+        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
         pipeline_path = Path(f"configs/pipelines/{name}.yaml")
         pipeline_path.parent.mkdir(parents=True, exist_ok=True)
         
@@ -150,7 +152,7 @@ class PipelineWizard:
 """
         
         # Serializar para YAML
-        yaml_content += yaml.dump(data, default_flow_style=False, sort_keys=False)
+        yaml_content += yaml.dump(data, Dumper=dumper, default_flow_style=False, sort_keys=False)
         
         # Salvar
         with open(pipeline_path, 'w', encoding='utf-8') as f:
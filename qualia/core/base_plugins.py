@@ -7,12 +7,74 @@ métodos de execução rodam em worker threads via asyncio.to_thread.
 Carregue modelos, corpora e recursos pesados no __init__.
 """
 
-from typing import Any, Dict, Optional, Tuple
+from functools import cached_property
+from itertools import islice
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple
 
 from qualia.core.interfaces import IAnalyzerPlugin, IDocumentPlugin, IVisualizerPlugin
 from qualia.core.models import Document
 
 
+# Quantas chaves dos dados listar na mensagem de campo faltante
+_FIELDS_IN_ERROR = 20
+
+
+def _describe_fields(data) -> str:
+    """Lista as chaves dos dados para mensagem de erro, truncada em payloads grandes."""
+    shown = [repr(k) for k in islice(data, _FIELDS_IN_ERROR)]
+    extra = len(data) - len(shown)
+    if extra > 0:
+        shown.append(f"... (+{extra})")
+    return "[" + ", ".join(shown) + "]"
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.lower() in ('true', '1', 'yes')
+    return bool(value)
+
+
+# type do schema → conversor; tipos fora daqui passam o valor sem conversão
+_COERCERS: Dict[str, Callable[[Any], Any]] = {
+    'integer': int, 'int': int,
+    'float': float,
+    'boolean': _to_bool, 'bool': _to_bool,
+}
+
+
+def _compile_validator(parameters: Dict[str, Any],
+                       exclude: set = None) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Pré-compila o schema de parâmetros numa função de validação.
+
+    O despacho por tipo é resolvido uma vez aqui. A função retornada parte
+    de uma cópia dos defaults e sobrescreve só o que veio no config.
+    """
+    exclude = exclude or set()
+    defaults = {
+        name: spec.get('default')
+        for name, spec in parameters.items() if name not in exclude
+    }
+    coercers = {
+        name: _COERCERS[spec.get('type')]
+        for name, spec in parameters.items()
+        if name in defaults and spec.get('type') in _COERCERS
+    }
+    allowed = frozenset(parameters) | frozenset(exclude)
+
+    def validate(config: Dict[str, Any]) -> Dict[str, Any]:
+        unknown = config.keys() - allowed
+        if unknown:
+            raise ValueError(f"Parâmetro(s) desconhecido(s): {', '.join(sorted(unknown))}")
+        validated = defaults.copy()
+        for name, value in config.items():
+            if name in validated:  # excluídos ficam de fora
+                coerce = coercers.get(name)
+                validated[name] = coerce(value) if coerce is not None else value
+        return validated
+
+    return validate
+
+
 def _validate_and_convert(config: Dict[str, Any], parameters: Dict[str, Any],
                           exclude: set = None) -> Dict[str, Any]:
     """Valida config contra schema de parâmetros: rejeita desconhecidos, converte tipos, aplica defaults.
@@ -22,36 +84,43 @@ def _validate_and_convert(config: Dict[str, Any], parameters: Dict[str, Any],
         parameters: Schema de meta().parameters
         exclude: Params a ignorar (ex: {"output_format"} para visualizers)
     """
-    exclude = exclude or set()
-    known_params = {k for k in parameters.keys() if k not in exclude}
-    unknown = set(config.keys()) - known_params - exclude
-    if unknown:
-        raise ValueError(f"Parâmetro(s) desconhecido(s): {', '.join(sorted(unknown))}")
-
-    validated = {}
-    for param_name, param_spec in parameters.items():
-        if param_name in exclude:
-            continue
-        if param_name in config:
-            value = config[param_name]
-            param_type = param_spec.get('type')
-            if param_type in ('integer', 'int'):
-                validated[param_name] = int(value)
-            elif param_type == 'float':
-                validated[param_name] = float(value)
-            elif param_type in ('boolean', 'bool'):
-                if isinstance(value, str):
-                    validated[param_name] = value.lower() in ('true', '1', 'yes')
-                else:
-                    validated[param_name] = bool(value)
-            else:
-                validated[param_name] = value
-        else:
-            validated[param_name] = param_spec.get('default')
-    return validated
+    return _compile_validator(parameters, exclude)(config)
+
+
+class _ConfigValidationMixin:
+    """validate_config/_validate_config comuns às três bases de plugin.
+
+    O validador é compilado do schema de meta().parameters no primeiro uso
+    e fica na instância. _CONFIG_EXCLUDE lista chaves aceitas no config mas
+    tratadas pela própria base, fora do schema (ex: output_format).
+    """
+
+    _CONFIG_EXCLUDE: FrozenSet[str] = frozenset()
+
+    @cached_property
+    def _meta(self):
+        """meta() resolvido uma vez por instância — metadata é estática (ver loader)."""
+        return self.meta()
+
+    @cached_property
+    def _compiled_validator(self):
+        """Validador do schema deste plugin, compilado na primeira execução."""
+        return _compile_validator(self._meta.parameters, self._CONFIG_EXCLUDE)
+
+    def _validate_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Valida e aplica defaults aos parâmetros, com conversão de tipos."""
+        return self._compiled_validator(config)
+
+    def validate_config(self, config: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+        """Valida configuração delegando para _validate_config"""
+        try:
+            self._validate_config(config)
+            return True, None
+        except Exception as e:
+            return False, str(e)
 
 
-class BaseAnalyzerPlugin(IAnalyzerPlugin):
+class BaseAnalyzerPlugin(_ConfigValidationMixin, IAnalyzerPlugin):
     """Base class com funcionalidades comuns para analyzers.
 
     Thread-safety: plugins são singletons. __init__ roda na main thread;
@@ -68,25 +137,13 @@ class BaseAnalyzerPlugin(IAnalyzerPlugin):
         validated_config = self._validate_config(config)
         return self._analyze_impl(document, validated_config, context)
 
-    def validate_config(self, config: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
-        """Valida configuração delegando para _validate_config"""
-        try:
-            self._validate_config(config)
-            return True, None
-        except Exception as e:
-            return False, str(e)
-
-    def _validate_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
-        """Valida e aplica defaults aos parâmetros, com conversão de tipos."""
-        return _validate_and_convert(config, self.meta().parameters)
-
     def _analyze_impl(self, document: Document, config: Dict[str, Any],
                       context: Dict[str, Any]) -> Dict[str, Any]:
         """Implementação real do analyzer - override este método"""
         raise NotImplementedError("Subclasse deve implementar _analyze_impl()")
 
 
-class BaseVisualizerPlugin(IVisualizerPlugin):
+class BaseVisualizerPlugin(_ConfigValidationMixin, IVisualizerPlugin):
     """Base class com funcionalidades comuns para visualizers.
 
     Plugin author implementa _render_impl(data, config) retornando:
@@ -101,12 +158,18 @@ class BaseVisualizerPlugin(IVisualizerPlugin):
     # Subclasse declara: "plotly", "matplotlib", ou "html"
     RENDER_LIB = "html"
 
+    # output_format é extraído por render(), mas validate_config() pode
+    # receber a config completa — aceito e ignorado pelo validador
+    _CONFIG_EXCLUDE = frozenset({"output_format"})
+
     def render(self, data, config):
         """Valida, renderiza e serializa visualização."""
         config = dict(config)  # cópia — não muta o dict do caller
         output_format = config.pop("output_format", "html")
         validated = self._validate_config(config)
-        self._validate_data(data)
+        data_check = self._data_check
+        if data_check is not None:
+            data_check(data)
         fig = self._render_impl(data, validated)
         return self._serialize(fig, output_format)
 
@@ -204,34 +267,38 @@ class BaseVisualizerPlugin(IVisualizerPlugin):
             BaseVisualizerPlugin._kaleido_result = False
         return BaseVisualizerPlugin._kaleido_result
 
-    def _validate_config(self, config):
-        """Valida e converte tipos dos parâmetros (exclui output_format, já extraído no render)."""
-        return _validate_and_convert(config, self.meta().parameters, exclude={"output_format"})
+    @cached_property
+    def _required_fields(self):
+        """requires na ordem declarada + frozenset, para checar por diferença."""
+        required = tuple(self._meta.requires or ())
+        return required, frozenset(required)
 
-    def validate_config(self, config):
-        """Valida config e retorna (ok, error_msg)."""
-        try:
-            # output_format é extraído por render() antes de _validate_config,
-            # mas validate_config() pode ser chamado diretamente com config completa
-            config = {k: v for k, v in config.items() if k != "output_format"}
-            self._validate_config(config)
-            return True, None
-        except Exception as e:
-            return False, str(e)
+    @cached_property
+    def _data_check(self):
+        """_validate_data a rodar no render, ou None se não há o que checar.
+
+        Sem requires e sem override de _validate_data, o render pula a chamada.
+        """
+        if (type(self)._validate_data is BaseVisualizerPlugin._validate_data
+                and not self._required_fields[1]):
+            return None
+        return self._validate_data
 
     def _validate_data(self, data):
         """Verifica que campos requeridos existem nos dados."""
-        meta = self.meta()
-        if meta.requires:
-            for field in meta.requires:
-                if field not in data:
-                    raise ValueError(
-                        f"Visualizador '{meta.id}' requer campo '{field}' nos dados. "
-                        f"Campos disponíveis: {list(data.keys())}"
-                    )
-
-
-class BaseDocumentPlugin(IDocumentPlugin):
+        required, required_set = self._required_fields
+        if required_set:
+            missing = required_set.difference(data)
+            if missing:
+                # Reporta o primeiro faltante na ordem do meta, como antes
+                field = next(f for f in required if f in missing)
+                raise ValueError(
+                    f"Visualizador '{self._meta.id}' requer campo '{field}' nos dados. "
+                    f"Campos disponíveis: {_describe_fields(data)}"
+                )
+
+
+class BaseDocumentPlugin(_ConfigValidationMixin, IDocumentPlugin):
     """Base class para document processors"""
 
     def process(self, document: Document, config: Dict[str, Any],
@@ -240,18 +307,6 @@ class BaseDocumentPlugin(IDocumentPlugin):
         validated_config = self._validate_config(config)
         return self._process_impl(document, validated_config, context)
 
-    def validate_config(self, config: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
-        """Valida configuração delegando para _validate_config"""
-        try:
-            self._validate_config(config)
-            return True, None
-        except Exception as e:
-            return False, str(e)
-
-    def _validate_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
-        """Valida e aplica defaults aos parâmetros, com conversão de tipos."""
-        return _validate_and_convert(config, self.meta().parameters)
-
     def _process_impl(self, document: Document, config: Dict[str, Any],
                       context: Dict[str, Any]) -> Dict[str, Any]:
         """Implementação real - override este método"""
@@ -5,6 +5,8 @@ Gerenciamento de cache com LRU e TTL para resultados de análises.
 
 import hashlib
 import json
+import mmap
+import os
 import pickle
 import threading
 import time
@@ -24,9 +26,14 @@ class CacheManager:
         cache_dir: diretório para arquivos .pkl
         max_size: máximo de entradas (0 = sem limite)
         ttl: time-to-live em segundos (0 = sem expiração)
+        mem_size: entradas mantidas em memória acima do disco (0 = desliga)
+        small_cutoff: resultados cujo pickle tem menos bytes que isso não são
+            gravados — recomputar sai mais barato que o round-trip no disco
+            (0 = grava tudo)
     """
 
-    def __init__(self, cache_dir: Path, max_size: int = 0, ttl: int = 0):
+    def __init__(self, cache_dir: Path, max_size: int = 0, ttl: int = 0,
+                 mem_size: int = 256, small_cutoff: int = 0):
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.max_size = max_size
@@ -45,6 +52,11 @@ class CacheManager:
         self._plugin_index: Dict[str, set] = {}
         # Forward mapping: cache_key → (doc_id, plugin_id) para O(1) em _remove_entry
         self._key_metadata: Dict[str, Tuple[str, str]] = {}
+        # LRU em memória: cache_key → bytes do pickle. Guarda os bytes, não o
+        # objeto — cada hit devolve cópia nova, como a leitura do disco
+        self.mem_size = mem_size
+        self._mem: OrderedDict = OrderedDict()
+        self.small_cutoff = small_cutoff
         # Reconstruir índices de entradas em disco (sobrevive a restart)
         self._rebuild_index()
 
@@ -80,30 +92,73 @@ class CacheManager:
         self._index_file.write_text(json.dumps(data))
 
     @staticmethod
-    def _canonicalize(obj: Any) -> Any:
-        """Converte recursivamente para forma canônica JSON-serializável.
+    def _canon_bytes(obj: Any, out: bytearray) -> None:
+        """Serializa obj em forma canônica direto num bytearray.
 
-        set/frozenset → sorted list, Path → str, dict → sorted keys,
-        demais → repr como fallback leaf.
+        Substitui o par _canonicalize + json.dumps(sort_keys=True): uma
+        passada só, sem dicts intermediários nem encoder JSON. Cada valor
+        leva um tag de tipo e strings são prefixadas pelo tamanho, então
+        não há ambiguidade entre, p.ex., 1, 1.0, True e "1".
+
+        dict → chaves ordenadas, set/frozenset → elementos ordenados,
+        list/tuple → sequência, Path → igual a str, demais → repr.
         """
-        if obj is None or isinstance(obj, (bool, int, float, str)):
-            return obj
-        if isinstance(obj, dict):
-            return {str(k): CacheManager._canonicalize(v) for k, v in sorted(obj.items())}
-        if isinstance(obj, (set, frozenset)):
-            return sorted((CacheManager._canonicalize(x) for x in obj), key=str)
-        if isinstance(obj, (list, tuple)):
-            return [CacheManager._canonicalize(x) for x in obj]
-        if isinstance(obj, Path):
-            return str(obj)
-        return f"{type(obj).__name__}:{obj!r}"
+        if obj is None:
+            out += b"N"
+        elif obj is True:
+            out += b"T"
+        elif obj is False:
+            out += b"F"
+        elif isinstance(obj, (str, Path)):
+            data = str(obj).encode()
+            out += b"s%d:" % len(data)
+            out += data
+        elif isinstance(obj, int):
+            out += b"i%d;" % obj
+        elif isinstance(obj, float):
+            out += b"f" + repr(obj).encode() + b";"
+        elif isinstance(obj, dict):
+            out += b"{"
+            for k, v in sorted(obj.items(), key=lambda kv: str(kv[0])):
+                CacheManager._canon_bytes(str(k), out)
+                CacheManager._canon_bytes(v, out)
+            out += b"}"
+        elif isinstance(obj, (list, tuple)):
+            out += b"["
+            for x in obj:
+                CacheManager._canon_bytes(x, out)
+            out += b"]"
+        elif isinstance(obj, (set, frozenset)):
+            parts = []
+            for x in obj:
+                buf = bytearray()
+                CacheManager._canon_bytes(x, buf)
+                parts.append(bytes(buf))
+            out += b"<"
+            out += b"".join(sorted(parts))
+            out += b">"
+        else:
+            data = f"{type(obj).__name__}:{obj!r}".encode()
+            out += b"o%d:" % len(data)
+            out += data
 
     def _get_cache_key(self, doc_id: str, plugin_id: str, config: Dict[str, Any]) -> str:
-        """Gera chave única para cache. Canônica para tipos Python comuns."""
-        canonical = self._canonicalize(config)
-        config_str = json.dumps(canonical, sort_keys=True)
-        content = f"{doc_id}:{plugin_id}:{config_str}"
-        return hashlib.sha256(content.encode()).hexdigest()
+        """Gera chave única para cache. Canônica para tipos Python comuns.
+
+        BLAKE2b de 128 bits (stdlib): mais rápido que SHA-256 e folgado contra
+        colisão para chave de cache. Separador NUL evita ambiguidade quando
+        doc_id/plugin_id contêm ':'.
+        """
+        canonical = bytearray()
+        self._canon_bytes(config, canonical)
+        # Hash incremental: mesmo digest da concatenação, sem montá-la
+        h = hashlib.blake2b(digest_size=16)
+        h.update(doc_id.encode())
+        h.update(b"\0")
+        h.update(plugin_id.encode())
+        h.update(b"\0")
+        h.update(canonical)
+        return h.hexdigest()
 
     def get(self, doc_id: str, plugin_id: str, config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Recupera resultado do cache se existir"""
@@ -111,30 +166,62 @@ class CacheManager:
         cache_file = self.cache_dir / f"{cache_key}.pkl"
 
         with self._lock:
-            if not cache_file.exists():
-                self._misses += 1
-                return None
-
-            # Reintegrar no tracking se carregado do disco (pós-restart)
-            if cache_key not in self._access_order:
-                self._access_order[cache_key] = None
-                self._timestamps[cache_key] = cache_file.stat().st_mtime
-                self._key_metadata[cache_key] = (doc_id, plugin_id)
-                self._doc_index.setdefault(doc_id, set()).add(cache_key)
-                self._plugin_index.setdefault(plugin_id, set()).add(cache_key)
-
-            # Checar TTL (após reintegração — cobre também arquivos do disco)
-            if self.ttl > 0 and cache_key in self._timestamps:
-                age = time.time() - self._timestamps[cache_key]
-                if age > self.ttl:
+            blob = self._mem.get(cache_key)
+            if blob is not None:
+                # Hit em memória: sem stat/open do arquivo
+                if self.ttl > 0 and time.time() - self._timestamps[cache_key] > self.ttl:
                     self._remove_entry(cache_key)
                     self._misses += 1
                     return None
+                self._mem.move_to_end(cache_key)
+                self._access_order.move_to_end(cache_key, last=True)
+                self._hits += 1
+
+        if blob is not None:
+            return pickle.loads(blob)
+
+        with self._lock:
+            # open() direto em vez de exists() + open(): um stat a menos por hit
+            try:
+                f = open(cache_file, 'rb')
+            except FileNotFoundError:
+                self._misses += 1
+                return None
+            except OSError:
+                self._remove_entry(cache_key)
+                self._misses += 1
+                return None
+
+            try:
+                # Reintegrar no tracking se carregado do disco (pós-restart)
+                if cache_key not in self._access_order:
+                    self._access_order[cache_key] = None
+                    self._timestamps[cache_key] = os.fstat(f.fileno()).st_mtime
+                    self._key_metadata[cache_key] = (doc_id, plugin_id)
+                    self._doc_index.setdefault(doc_id, set()).add(cache_key)
+                    self._plugin_index.setdefault(plugin_id, set()).add(cache_key)
 
-        # File I/O fora do lock
+                # Checar TTL (após reintegração — cobre também arquivos do disco)
+                expired = (self.ttl > 0 and cache_key in self._timestamps
+                           and time.time() - self._timestamps[cache_key] > self.ttl)
+            except BaseException:
+                f.close()
+                raise
+            if expired:
+                f.close()
+                self._remove_entry(cache_key)
+                self._misses += 1
+                return None
+
+        # File I/O fora do lock. mmap: unpickler lê direto das páginas do
+        # arquivo, sem cópia intermediária pelo buffer de IO do Python. Com a
+        # LRU em memória ligada, os bytes são copiados pra ela só depois de um
+        # unpickle bem-sucedido — essa é a única cópia do arquivo
         try:
-            with open(cache_file, 'rb') as f:
-                result = pickle.load(f)
+            with f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                result = pickle.loads(mm)
+                if self.mem_size > 0:
+                    blob = mm[:]
         except Exception:
             with self._lock:
                 self._remove_entry(cache_key)
@@ -144,16 +231,31 @@ class CacheManager:
         with self._lock:
             if cache_key in self._access_order:
                 self._access_order.move_to_end(cache_key, last=True)
+                if blob is not None:
+                    self._remember(cache_key, blob)
             self._hits += 1
 
         return result
 
-    def set(self, doc_id: str, plugin_id: str, config: Dict[str, Any], result: Dict[str, Any]) -> None:
+    def _remember(self, cache_key: str, blob: bytes) -> None:
+        """Guarda o pickle na LRU em memória, descartando o mais antigo."""
+        self._mem[cache_key] = blob
+        self._mem.move_to_end(cache_key)
+        if len(self._mem) > self.mem_size:
+            self._mem.popitem(last=False)
+
+    def set(self, doc_id: str, plugin_id: str, config: Dict[str, Any], result: Dict[str, Any],
+            force: bool = False) -> None:
         """Armazena resultado no cache.
 
-        Lock cobre eviction + write + tracking atomicamente.
-        Pickle de resultados locais é rápido o suficiente para segurar o lock.
+        Lock cobre eviction + write + tracking atomicamente. O pickle é
+        feito antes do lock — só depende de result.
+        force=True grava mesmo abaixo de small_cutoff.
         """
+        blob = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        if not force and len(blob) < self.small_cutoff:
+            return
+
         cache_key = self._get_cache_key(doc_id, plugin_id, config)
         cache_file = self.cache_dir / f"{cache_key}.pkl"
 
@@ -166,7 +268,9 @@ class CacheManager:
 
             # File I/O + tracking sob o mesmo lock — garante atomicidade
             with open(cache_file, 'wb') as f:
-                pickle.dump(result, f)
+                f.write(blob)
+            if self.mem_size > 0:
+                self._remember(cache_key, blob)
 
             self._access_order[cache_key] = None
             self._access_order.move_to_end(cache_key, last=True)
@@ -176,10 +280,18 @@ class CacheManager:
             self._plugin_index.setdefault(plugin_id, set()).add(cache_key)
             self._save_index()
 
-    def _remove_entry(self, cache_key: str) -> None:
-        """Remove uma entrada do cache (arquivo, tracking e índices). O(1) via forward mapping."""
-        cache_file = self.cache_dir / f"{cache_key}.pkl"
-        cache_file.unlink(missing_ok=True)
+    def _remove_entry(self, cache_key: str, save_index: bool = True) -> None:
+        """Remove uma entrada do cache (arquivo, tracking e índices). O(1) via forward mapping.
+
+        save_index=False deixa a persistência do índice para o chamador —
+        remoções em lote gravam o índice uma vez só.
+        """
+        # os.unlink com path em str: sem construir Path por entrada em lotes
+        try:
+            os.unlink(os.path.join(self.cache_dir, f"{cache_key}.pkl"))
+        except FileNotFoundError:
+            pass
+        self._mem.pop(cache_key, None)
         self._timestamps.pop(cache_key, None)
         self._access_order.pop(cache_key, None)
         ids = self._key_metadata.pop(cache_key, None)
@@ -195,14 +307,16 @@ class CacheManager:
                 plugin_set.discard(cache_key)
                 if not plugin_set:
                     del self._plugin_index[plugin_id]
-        self._save_index()
+        if save_index:
+            self._save_index()
 
     def _evict_lru(self) -> None:
         """Remove a entrada menos recentemente usada"""
         if not self._access_order:
             return
         oldest_key = next(iter(self._access_order))
-        self._remove_entry(oldest_key)
+        # Só chamado por set(), que grava o índice ao final
+        self._remove_entry(oldest_key, save_index=False)
         self._evictions += 1
 
     def invalidate(self, doc_id: Optional[str] = None, plugin_id: Optional[str] = None) -> None:
@@ -221,15 +335,24 @@ class CacheManager:
             else:
                 keys_to_remove = set(plugin_keys)
 
+            # Índice gravado uma vez no fim, não a cada arquivo removido
             for cache_key in keys_to_remove:
-                self._remove_entry(cache_key)
+                self._remove_entry(cache_key, save_index=False)
+            if keys_to_remove:
+                self._save_index()
 
     def clear(self) -> None:
         """Remove todas as entradas do cache"""
         with self._lock:
-            for cache_file in self.cache_dir.glob("*.pkl"):
-                cache_file.unlink(missing_ok=True)
+            with os.scandir(self.cache_dir) as it:
+                targets = [e.path for e in it if e.name.endswith(".pkl")]
+            for path in targets:
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
             self._access_order.clear()
+            self._mem.clear()
             self._timestamps.clear()
             self._hits = 0
             self._misses = 0
@@ -9,7 +9,9 @@ Responsabilidades:
 """
 
 import logging
-from typing import Dict, Any, List, Optional, Tuple
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Callable, Dict, Any, FrozenSet, List, Mapping, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +29,16 @@ _TYPE_NORMALIZE = {
     "dict": "dict",
 }
 
+# Classes aceitas por tipo normalizado — resolvidas uma vez por parâmetro
+_TYPE_TUPLES = {
+    "int": (int,),
+    "float": (int, float),
+    "bool": (bool,),
+    "str": (str,),
+    "list": (list,),
+    "dict": (dict,),
+}
+
 # Limites padrão para categorias de tamanho de texto
 TEXT_SIZE_THRESHOLDS = {
     "short_text": 500,    # até 500 palavras
@@ -34,6 +46,72 @@ TEXT_SIZE_THRESHOLDS = {
     # acima de 5000 = long_text
 }
 
+# Mesmos limites em forma ordenada para bisect — limite inclusivo à esquerda
+_SIZE_LIMITS = (TEXT_SIZE_THRESHOLDS["short_text"], TEXT_SIZE_THRESHOLDS["medium"])
+_SIZE_CATEGORIES = ("short_text", "medium", "long_text")
+
+
+_MISSING = object()
+
+
+@dataclass(slots=True, frozen=True)
+class _ParamSchema:
+    """
+    Forma interna de um parâmetro normalizado, usada nos caminhos quentes.
+
+    O schema público continua sendo dict (vai para JSON na API e no
+    consolidated view); esta versão só evita lookups de chave repetidos
+    em validate_config / get_config_for_plugin.
+    """
+    type: str
+    types: Optional[Tuple[type, ...]] = None  # None = tipo desconhecido
+    reject_bool: bool = False  # bool é subclasse de int — "int" recusa bool
+    default: Any = _MISSING
+    range: Optional[Tuple[Any, Any]] = None
+    options: Optional[Tuple[Any, ...]] = None
+    option_set: Optional[FrozenSet[Any]] = None
+    text_size_adjustments: Optional[Mapping[str, Any]] = None
+
+    @classmethod
+    def from_dict(cls, param: Dict[str, Any]) -> "_ParamSchema":
+        range_spec = param.get("range")
+        if range_spec is not None:
+            range_spec = (
+                range_spec[0] if len(range_spec) > 0 else None,
+                range_spec[1] if len(range_spec) > 1 else None,
+            )
+
+        options = param.get("options")
+        option_set = None
+        if options is not None:
+            options = tuple(options)
+            try:
+                option_set = frozenset(options)
+            except TypeError:
+                option_set = None  # opções não-hasheáveis: fica no scan da tupla
+
+        return cls(
+            type=param["type"],
+            types=_TYPE_TUPLES.get(param["type"]),
+            reject_bool=param["type"] == "int",
+            default=param.get("default", _MISSING),
+            range=range_spec,
+            options=options,
+            option_set=option_set,
+            text_size_adjustments=param.get("text_size_adjustments") or None,
+        )
+
+    def allows(self, value: Any) -> bool:
+        """True se value está nas options (ou se não há options)."""
+        if self.options is None:
+            return True
+        if self.option_set is not None:
+            try:
+                return value in self.option_set
+            except TypeError:
+                pass
+        return value in self.options
+
 
 class ConfigurationRegistry:
     """
@@ -54,11 +132,25 @@ class ConfigurationRegistry:
                                  Aceita ambos pra backward compatibility.
         """
         self._schemas: Dict[str, Dict[str, Any]] = {}
+        # Espelho interno dos parâmetros em slots — lido por validate/get_config
+        self._params: Dict[str, Dict[str, _ParamSchema]] = {}
+        # Templates de get_config_for_plugin: defaults e ajustes por text_size
+        self._defaults: Dict[str, Dict[str, Any]] = {}
+        self._adjustments: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        # Um validador compilado por plugin (closures montadas uma vez)
+        self._validators: Dict[str, Callable[[Dict[str, Any]], Tuple[bool, List[str]]]] = {}
 
         for plugin_id, value in plugins_or_registry.items():
             # Se é instância de plugin, extrai metadata. Se já é metadata, usa direto.
             meta = value.meta() if hasattr(value, 'meta') else value
-            self._schemas[plugin_id] = self._normalize_schema(meta)
+            schema = self._normalize_schema(meta)
+            self._schemas[plugin_id] = schema
+            self._params[plugin_id] = {
+                name: _ParamSchema.from_dict(param)
+                for name, param in schema["parameters"].items()
+            }
+            self._validators[plugin_id] = self._compile_validator(self._params[plugin_id])
+            self._build_config_templates(plugin_id, self._params[plugin_id])
 
     # ------------------------------------------------------------------
     # Schema
@@ -134,65 +226,70 @@ class ConfigurationRegistry:
         Returns:
             (is_valid, list_of_errors)
         """
-        schema = self._schemas.get(plugin_id)
-        if schema is None:
+        validator = self._validators.get(plugin_id)
+        if validator is None:
             return False, [f"Plugin '{plugin_id}' não encontrado no registry"]
+        return validator(config)
 
-        errors: List[str] = []
-        params = schema["parameters"]
-
-        for key, value in config.items():
-            if key not in params:
-                errors.append(f"Parâmetro desconhecido: '{key}'")
-                continue
+    def _compile_validator(
+        self, params: Dict[str, _ParamSchema]
+    ) -> Callable[[Dict[str, Any]], Tuple[bool, List[str]]]:
+        """
+        Monta o validador de um plugin: uma closure por parâmetro, só com
+        os checks que o parâmetro de fato declara (range/options).
+        """
+        checks = {key: self._compile_param_check(key, param) for key, param in params.items()}
+
+        def validator(config: Dict[str, Any]) -> Tuple[bool, List[str]]:
+            errors: List[str] = []
+            for key, value in config.items():
+                check = checks.get(key)
+                if check is None:
+                    errors.append(f"Parâmetro desconhecido: '{key}'")
+                    continue
+                check(value, errors)
+            return (len(errors) == 0, errors)
+
+        return validator
+
+    def _compile_param_check(self, key: str, param: _ParamSchema) -> Callable[[Any, List[str]], None]:
+        """Closure que valida um valor e acumula erros em `errors`."""
+        validate_range = self._validate_range
+        expected = param.type
+        expected_types = param.types
+        reject_bool = param.reject_bool
+        range_spec = param.range
+        allows = param.allows if param.options is not None else None
+        options_repr = list(param.options) if param.options is not None else None
 
-            param = params[key]
-            param_type = param["type"]
+        if expected_types is None:
+            # Tipo desconhecido no schema: todo valor é rejeitado, sem checar nada
+            def reject(value: Any, errors: List[str]) -> None:
+                errors.append(f"'{key}': tipo desconhecido '{expected}'")
+            return reject
 
+        def check(value: Any, errors: List[str]) -> None:
             # Validar tipo
-            type_error = self._validate_type(key, value, param_type)
-            if type_error:
-                errors.append(type_error)
-                continue
+            if reject_bool and value.__class__ is bool:
+                errors.append(f"'{key}': esperado int, recebido bool")
+                return
+            if not isinstance(value, expected_types):
+                errors.append(f"'{key}': esperado {expected}, recebido {type(value).__name__}")
+                return
 
             # Validar range
-            if "range" in param:
-                range_error = self._validate_range(key, value, param["range"])
+            if range_spec is not None:
+                range_error = validate_range(key, value, range_spec)
                 if range_error:
                     errors.append(range_error)
 
             # Validar options
-            if "options" in param:
-                if value not in param["options"]:
-                    errors.append(
-                        f"'{key}': valor '{value}' não está nas opções permitidas: {param['options']}"
-                    )
+            if allows is not None and not allows(value):
+                errors.append(
+                    f"'{key}': valor '{value}' não está nas opções permitidas: {options_repr}"
+                )
 
-        return (len(errors) == 0, errors)
-
-    def _validate_type(self, key: str, value: Any, expected: str) -> Optional[str]:
-        """Valida tipo de um valor."""
-        type_map = {
-            "int": (int,),
-            "float": (int, float),
-            "bool": (bool,),
-            "str": (str,),
-            "list": (list,),
-            "dict": (dict,),
-        }
-
-        expected_types = type_map.get(expected)
-        if expected_types is None:
-            return f"'{key}': tipo desconhecido '{expected}'"
-
-        # bool é subclasse de int em Python — tratar separadamente
-        if expected == "int" and isinstance(value, bool):
-            return f"'{key}': esperado int, recebido bool"
-
-        if not isinstance(value, expected_types):
-            return f"'{key}': esperado {expected}, recebido {type(value).__name__}"
-
-        return None
+        return check
 
     def _validate_range(self, key: str, value: Any, range_spec: List) -> Optional[str]:
         """Valida range [min, max]."""
@@ -216,12 +313,18 @@ class ConfigurationRegistry:
     @staticmethod
     def get_text_size_category(word_count: int) -> str:
         """Categoriza texto por número de palavras."""
-        if word_count <= TEXT_SIZE_THRESHOLDS["short_text"]:
-            return "short_text"
-        elif word_count <= TEXT_SIZE_THRESHOLDS["medium"]:
-            return "medium"
-        else:
-            return "long_text"
+        return _SIZE_CATEGORIES[bisect_left(_SIZE_LIMITS, word_count)]
+
+    @staticmethod
+    def get_text_size_categories(word_counts):
+        """Versão em lote de get_text_size_category (numpy.searchsorted).
+
+        Aceita qualquer sequência de contagens e devolve ndarray de str.
+        """
+        import numpy as np  # lazy: só quem roteia em lote paga o import
+
+        idx = np.searchsorted(_SIZE_LIMITS, np.asarray(word_counts), side="left")
+        return np.take(np.asarray(_SIZE_CATEGORIES), idx)
 
     # ------------------------------------------------------------------
     # Resolução de config (cascata)
@@ -244,25 +347,25 @@ class ConfigurationRegistry:
         Returns:
             Dict com valores finais de cada parâmetro
         """
-        schema = self._schemas.get(plugin_id)
-        if schema is None:
+        defaults = self._defaults.get(plugin_id)
+        if defaults is None:
             return {}
-
-        config: Dict[str, Any] = {}
-        params = schema["parameters"]
-
-        # 1. Defaults
-        for param_name, param_spec in params.items():
-            if "default" in param_spec:
-                config[param_name] = param_spec["default"]
-
-        # 2. Text size adjustments
-        for param_name, param_spec in params.items():
-            adjustments = param_spec.get("text_size_adjustments", {})
-            if text_size in adjustments:
-                config[param_name] = adjustments[text_size]
-
-        return config
+        # Merge em C sobre templates prontos — sempre um dict novo para o chamador
+        return defaults | self._adjustments[plugin_id].get(text_size, {})
+
+    def _build_config_templates(self, plugin_id: str, params: Dict[str, _ParamSchema]) -> None:
+        """Pré-computa a cascata default → text_size de um plugin."""
+        defaults: Dict[str, Any] = {}
+        adjustments: Dict[str, Dict[str, Any]] = {}
+
+        for param_name, param in params.items():
+            if param.default is not _MISSING:
+                defaults[param_name] = param.default
+            for text_size, value in (param.text_size_adjustments or {}).items():
+                adjustments.setdefault(text_size, {})[param_name] = value
+
+        self._defaults[plugin_id] = defaults
+        self._adjustments[plugin_id] = adjustments
 
     # ------------------------------------------------------------------
     # Visão consolidada
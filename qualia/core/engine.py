@@ -5,7 +5,7 @@ QualiaCore — orquestrador principal, completamente agnóstico.
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from qualia.core.cache import CacheManager
 from qualia.core.config import ConfigurationRegistry
@@ -14,6 +14,11 @@ from qualia.core.loader import PluginLoader
 from qualia.core.models import Document, ExecutionContext, PipelineConfig
 from qualia.core.resolver import DependencyResolver
 
+# Resultados com pickle menor que isso não vão pro cache (recomputar é mais
+# barato que o round-trip no disco) — cache_hint="always" e plugins com
+# requires gravam mesmo assim
+CACHE_SMALL_CUTOFF = 256
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,7 +32,9 @@ class QualiaCore:
 
     def __init__(self,
                  plugins_dir: Path = None,
-                 cache_dir: Path = None):
+                 cache_dir: Path = None,
+                 plugin_index: Path = None,
+                 cache_small_cutoff: int = CACHE_SMALL_CUTOFF):
         # Resolve paths relativos ao pacote, não ao cwd
         _project_root = Path(__file__).resolve().parent.parent.parent
         if plugins_dir is None:
@@ -42,15 +49,22 @@ class QualiaCore:
         # Sistemas auxiliares
         self.loader = PluginLoader(plugins_dir)
         self.resolver = DependencyResolver()
-        self.cache = CacheManager(cache_dir)
+        self.cache = CacheManager(cache_dir, small_cutoff=cache_small_cutoff)
 
         self.config_registry: Optional[ConfigurationRegistry] = None
 
+        # Ordens topológicas já resolvidas, válidas enquanto o resolver for o mesmo
+        self._resolve_owner: Optional[DependencyResolver] = None
+        self._resolve_cache: Dict[str, Tuple[str, ...]] = {}
+
+        # Índice de warm-start do discovery (opcional — a CLI usa, a API não)
+        self.plugin_index = plugin_index
+
         self.discover_plugins()
 
     def discover_plugins(self) -> Dict[str, PluginMetadata]:
         """Descobre plugins disponíveis. Core não sabe o que vai encontrar."""
-        self.registry = self.loader.discover()
+        self.registry = self.loader.discover(self.plugin_index)
         # plugins aponta pro mesmo dict do loader — lazy plugins aparecem quando instanciados
         self.plugins = self.loader.loaded_plugins
 
@@ -73,14 +87,36 @@ class QualiaCore:
             raise ValueError(f"Plugin '{plugin_id}' não encontrado")
         return plugin
 
+    def _execution_order(self, plugin_id: str) -> Tuple[str, ...]:
+        """Ordem topológica de plugin_id (deps + ele mesmo), memoizada por resolver."""
+        if self._resolve_owner is not self.resolver:
+            self._resolve_owner = self.resolver
+            self._resolve_cache = {}
+        order = self._resolve_cache.get(plugin_id)
+        if order is None:
+            order = tuple(self.resolver.resolve([plugin_id]))
+            self._resolve_cache[plugin_id] = order
+        return order
+
     def execute_plugin(self,
                        plugin_id: str,
                        document: Document,
                        config: Dict[str, Any] = None,
                        context: Dict[str, Any] = None) -> Dict[str, Any]:
         """Executa um plugin sem saber o que ele faz. Resolve dependências automaticamente."""
-        config = config or {}
-
+        return self._execute(plugin_id, document, config or {}, context)
+
+    def _execute(self,
+                 plugin_id: str,
+                 document: Document,
+                 config: Dict[str, Any],
+                 context: Optional[Dict[str, Any]],
+                 dep_results: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Executa um plugin. Com dep_results=None resolve e executa as
+        dependências num passo iterativo só (uma ordem topológica para a
+        árvore toda); com dep_results dado, usa os resultados recebidos.
+        """
         if plugin_id not in self.registry:
             raise ValueError(f"Plugin '{plugin_id}' não encontrado")
 
@@ -102,24 +138,32 @@ class QualiaCore:
         if cached is not None:
             return cached
 
-        # Cria contexto de execução
-        exec_context = ExecutionContext(document=document)
-
-        # Resolve dependências via ordenação topológica
-        if metadata.requires:
-            try:
-                execution_order = self.resolver.resolve([plugin_id])
-            except ValueError as e:
-                raise ValueError(f"Erro de dependência para '{plugin_id}': {e}")
-            for dep_id in execution_order:
-                if dep_id == plugin_id:
-                    continue
-                dep_result = self.execute_plugin(dep_id, document, {}, context)
-                exec_context.add_result(dep_id, dep_result)
+        if dep_results is None:
+            # Cria contexto de execução
+            exec_context = ExecutionContext(document=document)
+
+            # Resolve dependências via ordenação topológica — cada dep roda uma
+            # vez, na ordem, recebendo só os resultados da própria subárvore
+            if metadata.requires:
+                try:
+                    execution_order = self._execution_order(plugin_id)
+                except ValueError as e:
+                    raise ValueError(f"Erro de dependência para '{plugin_id}': {e}")
+                for dep_id in execution_order:
+                    if dep_id == plugin_id:
+                        continue
+                    dep_meta = self.registry.get(dep_id)
+                    sub_results = (
+                        exec_context.get_dependency_results(self._execution_order(dep_id))
+                        if dep_meta is not None and dep_meta.requires else {}
+                    )
+                    dep_result = self._execute(dep_id, document, {}, context, sub_results)
+                    exec_context.add_result(dep_id, dep_result)
+
+            dep_results = dict(exec_context.results)
 
         # Executa o plugin baseado em seu tipo
         result = None
-        dep_results = dict(exec_context.results)
 
         if metadata.type == PluginType.ANALYZER:
             analyzer_context = {**(context or {}), **dep_results}
@@ -147,9 +191,11 @@ class QualiaCore:
                     f"mas resultado não contém: {missing}"
                 )
 
-        # Armazena no cache (mesma chave com context)
-        if result is not None:
-            self.cache.set(document.id, plugin_id, cache_config, result)
+        # Armazena no cache (mesma chave com context). Plugins com dependências
+        # sempre gravam: recomputar custaria a cadeia, não só o plugin
+        if result is not None and metadata.cache_hint != "never":
+            force = metadata.cache_hint == "always" or bool(metadata.requires)
+            self.cache.set(document.id, plugin_id, cache_config, result, force=force)
 
         if result is None:
             logger.warning("Plugin '%s' retornou None", plugin_id)
@@ -9,6 +9,10 @@ from enum import Enum
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 
+# Valores aceitos em PluginMetadata.cache_hint
+CACHE_HINTS = frozenset({"auto", "always", "never"})
+
+
 class PluginType(Enum):
     """Tipos de plugins que o Core pode orquestrar"""
     ANALYZER = "analyzer"
@@ -29,6 +33,15 @@ class PluginMetadata:
     can_use: List[str] = field(default_factory=list)
     accepts: List[str] = field(default_factory=list)
     parameters: Dict[str, Any] = field(default_factory=dict)
+    # Persistência no cache: "auto" (CacheManager decide), "always" ou "never"
+    cache_hint: str = "auto"
+
+    def __post_init__(self):
+        if self.cache_hint not in CACHE_HINTS:
+            raise ValueError(
+                f"cache_hint inválido: {self.cache_hint!r} "
+                f"(use {', '.join(sorted(CACHE_HINTS))})"
+            )
 
     def get_dependencies(self) -> Set[str]:
         """Retorna todas as dependências (obrigatórias e opcionais)"""
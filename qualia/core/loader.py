@@ -3,12 +3,16 @@
 Auto-descoberta e carregamento de plugins com instanciação eager/lazy.
 """
 
+import ast
+import dataclasses
 import importlib.util
-import inspect
+import json
 import logging
+import os
 import sys
 import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -18,8 +22,48 @@ from qualia.core.interfaces import (
     IPlugin,
     IVisualizerPlugin,
     PluginMetadata,
+    PluginType,
 )
 
+# Versão do formato do índice de warm-start — mudou, índice antigo é descartado
+INDEX_VERSION = 2
+
+# Interfaces abstratas — nunca registradas como plugin
+_INTERFACES = frozenset({IPlugin, IAnalyzerPlugin, IVisualizerPlugin, IDocumentPlugin})
+
+# Threads para importar pastas de plugin em paralelo no discovery
+_IMPORT_WORKERS = min(8, os.cpu_count() or 1)
+
+
+def _meta_to_dict(meta: PluginMetadata) -> dict:
+    data = dataclasses.asdict(meta)
+    data["type"] = meta.type.value
+    return data
+
+
+def _meta_from_dict(data: dict) -> PluginMetadata:
+    return PluginMetadata(**{**data, "type": PluginType(data["type"])})
+
+
+def _top_level_imports(plugin_dir: Path) -> list:
+    """Módulos absolutos importados no corpo dos .py da pasta (nome de topo).
+
+    Só o nível do módulo, fora de try — imports opcionais e os de dentro de
+    funções não quebram o import da pasta. Relativos ficam de fora.
+    """
+    names = set()
+    for py_file in plugin_dir.rglob("*.py"):
+        try:
+            tree = ast.parse(py_file.read_bytes())
+        except (OSError, SyntaxError, ValueError):
+            continue
+        for node in tree.body:
+            if isinstance(node, ast.Import):
+                names.update(alias.name.partition(".")[0] for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and not node.level and node.module:
+                names.add(node.module.partition(".")[0])
+    return sorted(names)
+
 
 class PluginLoader:
     """Carrega plugins com instanciação lazy ou eager automática.
@@ -38,6 +82,8 @@ class PluginLoader:
         self.plugins_dir = plugins_dir
         self.loaded_plugins: Dict[str, IPlugin] = {}
         self._plugin_classes: Dict[str, type] = {}
+        # Plugins vindos do índice de warm-start: id → (pasta, nome da classe, eager)
+        self._deferred: Dict[str, tuple] = {}
         self._lock = threading.Lock()
         self.discovery_errors: list = []
 
@@ -55,49 +101,193 @@ class PluginLoader:
             plugin_dirs.append(plugin_dir)
         return plugin_dirs
 
-    def discover(self) -> Dict[str, PluginMetadata]:
+    @staticmethod
+    def _dir_signature(plugin_dir: Path) -> list:
+        """Assinatura barata da pasta: (arquivo, mtime_ns, tamanho) de cada .py."""
+        signature = []
+        for py_file in sorted(plugin_dir.rglob("*.py")):
+            st = py_file.stat()
+            signature.append([str(py_file.relative_to(plugin_dir)), st.st_mtime_ns, st.st_size])
+        return signature
+
+    def _import_module(self, plugin_dir: Path):
+        """Importa o __init__.py da pasta do plugin com nome de módulo único."""
+        # Nome único derivado do path relativo (evita colisão entre plugins em subpastas)
+        rel = plugin_dir.relative_to(self.plugins_dir)
+        module_name = "qualia_plugin_" + ".".join(rel.parts)
+        spec = importlib.util.spec_from_file_location(
+            module_name,
+            plugin_dir / "__init__.py",
+            submodule_search_locations=[str(plugin_dir)],
+        )
+        if not (spec and spec.loader):
+            return None
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            # Módulo pela metade não fica registrado — a próxima tentativa reexecuta do zero
+            sys.modules.pop(module_name, None)
+            raise
+        return module
+
+    def _read_index(self, index_path: Path) -> Dict[str, dict]:
+        """Lê o índice de warm-start. Índice ausente, corrompido ou de outra pasta → vazio."""
+        try:
+            data = json.loads(index_path.read_text())
+        except (OSError, ValueError):
+            return {}
+        if (not isinstance(data, dict)
+                or data.get("version") != INDEX_VERSION
+                or data.get("plugins_dir") != str(self.plugins_dir)):
+            return {}
+        entries = data.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    @staticmethod
+    def _warm_entries(cached, signature) -> Optional[list]:
+        """Valida a entrada do índice de uma pasta → [(meta, classe)].
+
+        Assinatura divergente, entrada malformada, plugin eager (warm-up é na
+        main thread, durante o discover) ou módulo externo que sumiu → None
+        (cache miss: a pasta é reimportada e um import quebrado vira
+        discovery_error, o plugin nunca é descartado por causa do índice).
+        """
+        try:
+            if cached["signature"] != signature:
+                return None
+            warm = []
+            for entry in cached["plugins"]:
+                if entry["eager"] or not isinstance(entry["class"], str):
+                    return None
+                warm.append((_meta_from_dict(entry["meta"]), entry["class"]))
+            if not all(importlib.util.find_spec(name) for name in cached["imports"]):
+                return None
+        except Exception:
+            return None
+        return warm or None
+
+    def _record_error(self, plugin_dir: Path, exc: Exception) -> None:
+        """Registra falha de carregamento da pasta em discovery_errors (uma vez por pasta)."""
+        logging.getLogger(__name__).error(f"Erro ao carregar plugin {plugin_dir.name}: {exc}")
+        path = str(plugin_dir)
+        if any(err["path"] == path for err in self.discovery_errors):
+            return
+        error_type, severity = self._classify_error(exc)
+        self.discovery_errors.append({
+            "plugin": plugin_dir.name,
+            "error": str(exc),
+            "path": path,
+            "type": error_type,
+            "severity": severity,
+        })
+
+    def _write_index(self, index_path: Path, entries: Dict[str, dict]) -> None:
+        """Grava o índice de forma atômica (tmp + replace). Falha de escrita não é fatal."""
+        payload = {
+            "version": INDEX_VERSION,
+            "plugins_dir": str(self.plugins_dir),
+            "entries": entries,
+        }
+        try:
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = index_path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(payload))
+            tmp.replace(index_path)
+        except (OSError, TypeError, ValueError) as e:
+            logging.getLogger(__name__).debug(f"Índice de plugins não gravado: {e}")
+
+    def discover(self, index_path: Optional[Path] = None) -> Dict[str, PluginMetadata]:
         """Descobre plugins em qualquer profundidade e instancia os que precisam de warm-up.
 
         Plugins com __init__ próprio → instanciados agora (main thread, thread-safe).
         Plugins sem __init__ próprio → classe guardada, instanciação deferida.
         Metadata extraída via object.__new__() pra lazy (sem __init__).
         Convenção: meta() não deve depender de estado inicializado em __init__.
+
+        Com index_path (warm-start, usado pela CLI): pastas cuja assinatura bate
+        com o índice não são importadas — metadata vem do índice e o módulo só é
+        importado no primeiro get_plugin(), uma vez por pasta. Pastas alteradas,
+        com plugin eager (warm-up continua aqui, na main thread) ou cujos imports
+        externos sumiram são reimportadas e o índice é regravado.
         """
         logger = logging.getLogger(__name__)
         discovered = {}
         self.discovery_errors = []
         self.loaded_plugins.clear()
         self._plugin_classes.clear()
+        self._deferred.clear()
 
         if not self.plugins_dir.exists():
             return discovered
 
         t_total = time.perf_counter()
+        index = self._read_index(index_path) if index_path else {}
+        new_index: Dict[str, dict] = {}
+        from_index = 0
 
+        # 1ª passada: assinatura e decisão índice × import, sem registrar nada
+        plan = []  # (plugin_dir, rel_key, signature, cached | None, warm | None, erro | None)
         for plugin_dir in self._find_plugin_dirs():
+            try:
+                rel_key = str(plugin_dir.relative_to(self.plugins_dir))
+                signature = self._dir_signature(plugin_dir) if index_path else None
+                cached = index.get(rel_key)
+                warm = self._warm_entries(cached, signature) if cached is not None else None
+                if warm is None:
+                    cached = None
+                plan.append((plugin_dir, rel_key, signature, cached, warm, None))
+            except Exception as e:
+                plan.append((plugin_dir, None, None, None, None, e))
+
+        # Imports das pastas fora do índice em paralelo: exec_module de
+        # extensões C (numpy, spacy...) solta o GIL. Varredura das classes e
+        # instanciação eager continuam na main thread, na ordem das pastas
+        to_import = [d for d, _, _, cached, _, err in plan if cached is None and err is None]
+        imports: Dict[Path, Future] = {}
+        executor = None
+        if len(to_import) > 1:
+            executor = ThreadPoolExecutor(
+                max_workers=min(_IMPORT_WORKERS, len(to_import)),
+                thread_name_prefix="qualia-discover",
+            )
+            imports = {d: executor.submit(self._import_module, d) for d in to_import}
+
+        try:
+            for plugin_dir, rel_key, signature, cached, warm, plan_error in plan:
                 try:
+                    if plan_error is not None:
+                        raise plan_error
                     t0 = time.perf_counter()
-                    # Nome único derivado do path relativo (evita colisão entre plugins em subpastas)
-                    rel = plugin_dir.relative_to(self.plugins_dir)
-                    module_name = "qualia_plugin_" + ".".join(rel.parts)
-                    spec = importlib.util.spec_from_file_location(
-                        module_name,
-                        plugin_dir / "__init__.py",
-                        submodule_search_locations=[str(plugin_dir)],
-                    )
-                    if spec and spec.loader:
-                        module = importlib.util.module_from_spec(spec)
-                        sys.modules[module_name] = module
-                        spec.loader.exec_module(module)
+
+                    if cached is not None:
+                        # Warm-start: metadata do índice, import adiado
+                        for meta, class_name in warm:
+                            if meta.id in discovered:
+                                raise ValueError(
+                                    f"Plugin ID duplicado: '{meta.id}' em '{plugin_dir.name}' "
+                                    f"(já registrado)"
+                                )
+                            self._deferred[meta.id] = (plugin_dir, class_name, False)
+                            discovered[meta.id] = meta
+                            logger.debug(f"Plugin {meta.id}: índice")
+                        new_index[rel_key] = cached
+                        from_index += 1
+                        continue
+
+                    future = imports.get(plugin_dir)
+                    module = future.result() if future else self._import_module(plugin_dir)
+                    if module is not None:
+                        entries = []
 
                         found_plugin = False
-                        for name, obj in inspect.getmembers(module):
-                            if name.startswith('Base'):
+                        # __dict__ direto (ordem de definição), sem o getattr
+                        # por membro do inspect.getmembers
+                        for name, obj in list(vars(module).items()):
+                            if name.startswith('Base') or not isinstance(obj, type):
                                 continue
-                            if (inspect.isclass(obj) and
-                                issubclass(obj, IPlugin) and
-                                obj not in [IPlugin, IAnalyzerPlugin,
-                                           IVisualizerPlugin, IDocumentPlugin]):
+                            if obj not in _INTERFACES and issubclass(obj, IPlugin):
 
                                 found_plugin = True
                                 needs_eager = getattr(obj, 'EAGER_LOAD', None) is True or '__init__' in obj.__dict__
@@ -125,28 +315,40 @@ class PluginLoader:
 
                                 self._plugin_classes[meta.id] = obj
                                 discovered[meta.id] = meta
+                                entries.append({
+                                    "class": obj.__name__,
+                                    "eager": needs_eager,
+                                    "meta": _meta_to_dict(meta),
+                                })
 
                         if not found_plugin:
                             logger.warning(f"Plugin dir '{plugin_dir.name}' não exporta nenhuma classe IPlugin")
+                        elif index_path:
+                            new_index[rel_key] = {
+                                "signature": signature,
+                                "plugins": entries,
+                                "imports": _top_level_imports(plugin_dir),
+                            }
 
                     elapsed = time.perf_counter() - t0
                     logger.debug(f"  {plugin_dir.name}: {elapsed:.3f}s")
 
                 except Exception as e:
-                    logger.error(f"Erro ao carregar plugin {plugin_dir.name}: {e}")
-                    error_type, severity = self._classify_error(e)
-                    self.discovery_errors.append({
-                        "plugin": plugin_dir.name,
-                        "error": str(e),
-                        "path": str(plugin_dir),
-                        "type": error_type,
-                        "severity": severity,
-                    })
+                    self._record_error(plugin_dir, e)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+        if index_path and new_index != index:
+            self._write_index(index_path, new_index)
 
         eager_count = len(self.loaded_plugins)
-        lazy_count = len(discovered) - eager_count
+        lazy_count = len(discovered) - eager_count - len(self._deferred)
         total = time.perf_counter() - t_total
-        logger.info(f"Discovery: {len(discovered)} plugins ({eager_count} eager, {lazy_count} lazy) em {total:.3f}s")
+        logger.info(
+            f"Discovery: {len(discovered)} plugins ({eager_count} eager, {lazy_count} lazy, "
+            f"{len(self._deferred)} do índice, {from_index} pastas sem import) em {total:.3f}s"
+        )
 
         return discovered
 
@@ -160,6 +362,22 @@ class PluginLoader:
             if plugin_id in self.loaded_plugins:
                 return self.loaded_plugins[plugin_id]
 
+            if plugin_id in self._deferred:
+                # Veio do índice — importa a pasta uma vez e resolve todas as
+                # classes dela desse mesmo módulo. Falhou: entradas ficam no
+                # _deferred, erro vai pra discovery_errors, retorno None
+                plugin_dir = self._deferred[plugin_id][0]
+                same_dir = [pid for pid, (d, _, _) in self._deferred.items() if d == plugin_dir]
+                try:
+                    module = self._import_module(plugin_dir)
+                    classes = {pid: getattr(module, self._deferred[pid][1]) for pid in same_dir}
+                except Exception as e:
+                    self._record_error(plugin_dir, e)
+                    return None
+                for pid in same_dir:
+                    del self._deferred[pid]
+                self._plugin_classes.update(classes)
+
             if plugin_id in self._plugin_classes:
                 instance = self._plugin_classes[plugin_id]()
                 self.loaded_plugins[plugin_id] = instance
@@ -167,6 +385,15 @@ class PluginLoader:
 
         return None
 
+    def is_eager(self, plugin_id: str) -> bool:
+        """True se o plugin precisa de warm-up (EAGER_LOAD ou __init__ próprio)."""
+        if plugin_id in self._deferred:
+            return self._deferred[plugin_id][2]
+        cls = self._plugin_classes.get(plugin_id)
+        return cls is not None and (
+            getattr(cls, 'EAGER_LOAD', None) is True or '__init__' in cls.__dict__
+        )
+
     @staticmethod
     def _classify_error(exc: Exception) -> tuple:
         """Classifica exceção por tipo e severidade.
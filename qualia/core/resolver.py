@@ -13,7 +13,9 @@ quando há um único provider para o campo.
 """
 
 import logging
-from typing import Dict, List, Optional, Set
+import sys
+from collections import deque
+from typing import Dict, FrozenSet, List, Optional, Set
 
 from qualia.core.interfaces import PluginMetadata
 
@@ -32,12 +34,17 @@ class DependencyResolver:
         self.graph: Dict[str, Set[str]] = {}
         self.metadata: Dict[str, PluginMetadata] = {}
         self._provides_map: Dict[str, List[str]] = {}  # field_name -> [plugin_ids]
+        # plugin_id -> ele mesmo + dependências transitivas (montado em build_graph)
+        self._closure: Dict[str, FrozenSet[str]] = {}
 
     def add_plugin(self, plugin_id: str, metadata: PluginMetadata) -> None:
         """Registra plugin e seus provides. Grafo construído em build_graph()."""
+        # IDs e campos internados: grafo, fecho e Kahn comparam por identidade
+        plugin_id = sys.intern(plugin_id)
         self.metadata[plugin_id] = metadata
 
         for field_name in metadata.provides:
+            field_name = sys.intern(field_name)
             if field_name not in self._provides_map:
                 self._provides_map[field_name] = []
             self._provides_map[field_name].append(plugin_id)
@@ -60,7 +67,7 @@ class DependencyResolver:
             resolved_deps: Set[str] = set()
             for req in metadata.requires:
                 if req in self.metadata:
-                    resolved_deps.add(req)
+                    resolved_deps.add(sys.intern(req))
                 elif req in self._provides_map:
                     providers = self._provides_map[req]
                     if len(providers) == 1:
@@ -78,6 +85,21 @@ class DependencyResolver:
                     )
             self.graph[plugin_id] = resolved_deps
 
+        # Registry é imutável após o discovery: fecho transitivo calculado uma
+        # vez aqui, resolve() só une conjuntos
+        self._closure = {p: self._reachable(p) for p in self.graph}
+
+    def _reachable(self, plugin_id: str) -> FrozenSet[str]:
+        """plugin_id e tudo que ele requer, direta ou indiretamente."""
+        seen = {plugin_id}
+        stack = [plugin_id]
+        while stack:
+            for dep in self.graph.get(stack.pop(), ()):
+                if dep not in seen:
+                    seen.add(dep)
+                    stack.append(dep)
+        return frozenset(seen)
+
     def resolve_provider(self, field_name: str) -> Optional[str]:
         """Retorna o plugin_id que provê um campo, ou None se ambíguo/inexistente."""
         providers = self._provides_map.get(field_name, [])
@@ -92,37 +114,48 @@ class DependencyResolver:
         Resolve ordem de execução incluindo todas as dependências.
         Detecta ciclos e retorna ordem topológica.
         """
-        # Coleta todas as dependências transitivas
-        all_plugins = set()
-        to_process = set(target_plugins)
-
-        while to_process:
-            plugin = to_process.pop()
-            if plugin not in all_plugins:
-                all_plugins.add(plugin)
-                if plugin in self.graph:
-                    to_process.update(self.graph[plugin])
-
-        # Ordena topologicamente
-        visited = set()
-        stack = []
-
-        def visit(plugin: str, path: list) -> None:
-            if plugin in set(path):
-                cycle_start = path.index(plugin)
-                cycle = path[cycle_start:] + [plugin]
-                raise ValueError(f"Dependência circular detectada: {' -> '.join(cycle)}")
-
-            if plugin not in visited:
-                path.append(plugin)
-                for dep in self.graph.get(plugin, []):
-                    if dep in all_plugins:
-                        visit(dep, list(path))
-                visited.add(plugin)
-                stack.append(plugin)
-
+        # Dependências transitivas vêm do fecho pré-calculado; plugin fora do
+        # grafo entra sozinho
+        all_plugins: Set[str] = set().union(
+            *(self._closure.get(p) or self._reachable(p) for p in target_plugins)
+        )
+
+        # Ordena topologicamente (Kahn): sem recursão nem cópia de caminho por aresta
+        indegree: Dict[str, int] = {}
+        dependents: Dict[str, List[str]] = {p: [] for p in all_plugins}
         for plugin in all_plugins:
-            if plugin not in visited:
-                visit(plugin, [])
-
-        return stack
+            deps = self.graph.get(plugin, set()) & all_plugins
+            indegree[plugin] = len(deps)
+            for dep in deps:
+                dependents[dep].append(plugin)
+
+        queue = deque(p for p, d in indegree.items() if d == 0)
+        order: List[str] = []
+        while queue:
+            plugin = queue.popleft()
+            order.append(plugin)
+            for dependent in dependents[plugin]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    queue.append(dependent)
+
+        if len(order) < len(all_plugins):
+            cycle = self._find_cycle({p for p, d in indegree.items() if d > 0})
+            raise ValueError(f"Dependência circular detectada: {' -> '.join(cycle)}")
+
+        return order
+
+    def _find_cycle(self, remaining: Set[str]) -> List[str]:
+        """Reconstrói um ciclo entre os nós que sobraram do Kahn.
+
+        Todo nó restante tem ao menos uma dependência também restante, então
+        seguir essas arestas a partir de qualquer nó fecha um ciclo.
+        """
+        path: List[str] = []
+        position: Dict[str, int] = {}
+        plugin = next(iter(remaining))
+        while plugin not in position:
+            position[plugin] = len(path)
+            path.append(plugin)
+            plugin = next(d for d in self.graph[plugin] if d in remaining)
+        return path[position[plugin]:] + [plugin]
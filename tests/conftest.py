@@ -24,13 +24,20 @@ def pytest_sessionfinish(session, exitstatus):
             shutil.rmtree(path)
 
 
-@pytest.fixture
-def client():
-    """Cliente de teste para a API"""
-    return TestClient(app)
+@pytest.fixture(scope="session")
+def api_client():
+    """Cliente de teste para a API (um por sessão — o app e os plugins já vêm prontos do import)"""
+    with TestClient(app) as c:
+        yield c
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def client(api_client):
+    """Cliente de teste para a API — módulos podem sobrescrever; api_client segue disponível"""
+    return api_client
+
+
+@pytest.fixture(scope="session")
 def sample_text():
     """Texto de exemplo para testes"""
     return "Este é um texto de teste. Teste teste palavra repetida repetida."
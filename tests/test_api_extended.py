@@ -51,10 +51,11 @@ def _mock_registry_entry(plugin_id, plugin_type_str):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
     """Cliente de teste para a API"""
-    return TestClient(app, raise_server_exceptions=False)
+    with TestClient(app, raise_server_exceptions=False) as c:
+        yield c
 
 
 @pytest.fixture
@@ -1555,8 +1556,9 @@ class TestConfigEndpoints:
     """Testes dos endpoints de config quando registry não está disponível."""
 
     @pytest.fixture
-    def client(self):
-        return TestClient(app)
+    def client(self, api_client):
+        """Cliente de sessão do conftest — exceção no servidor sobe com traceback"""
+        return api_client
 
     def test_plugin_schema_no_registry_returns_503(self, client):
         """GET /plugins/{id}/schema sem registry retorna 503."""
@@ -1588,8 +1590,9 @@ class TestHealthEndpoints:
     """Testes de health e root."""
 
     @pytest.fixture
-    def client(self):
-        return TestClient(app)
+    def client(self, api_client):
+        """Cliente de sessão do conftest — exceção no servidor sobe com traceback"""
+        return api_client
 
     def test_root_without_frontend_returns_api_info(self, client):
         """GET / sem frontend dist retorna info da API."""
@@ -7,9 +7,11 @@ com detecção de ciclos e resolução de field names.
 
 import pytest
 import pickle
+import sys
 from pathlib import Path
 import tempfile
 import shutil
+from unittest.mock import patch
 
 from qualia.core import CacheManager, DependencyResolver, PluginMetadata, PluginType
 
@@ -61,18 +63,38 @@ class TestCacheManager:
         result = {"count": 1}
         cache.set("doc1", "plugin", {"x": 1, "y": 2}, result)
         # Mesma config, ordem diferente das chaves — deve ser hit
-        # (json.dumps com sort_keys=True garante isso)
+        # (_canon_bytes ordena as chaves)
         cached = cache.get("doc1", "plugin", {"y": 2, "x": 1})
         assert cached == result
 
+    def test_cache_key_is_128_bit_hex(self, cache):
+        key = cache._get_cache_key("doc1", "plugin", {"x": 1})
+        assert len(key) == 32
+        int(key, 16)
+
+    def test_ids_with_separator_do_not_collide(self, cache):
+        assert (cache._get_cache_key("a:b", "c", {})
+                != cache._get_cache_key("a", "b:c", {}))
+
+    def test_cache_key_distinguishes_scalar_types(self, cache):
+        keys = {cache._get_cache_key("d", "p", {"x": v}) for v in (1, 1.0, True, "1", None)}
+        assert len(keys) == 5
+
+    def test_cache_key_set_order_and_path_are_canonical(self, cache):
+        assert (cache._get_cache_key("d", "p", {"s": {"b", "a", "c"}})
+                == cache._get_cache_key("d", "p", {"s": {"c", "a", "b"}}))
+        assert (cache._get_cache_key("d", "p", {"f": Path("x/y")})
+                == cache._get_cache_key("d", "p", {"f": "x/y"}))
+
     def test_different_doc_is_miss(self, cache):
         result = {"count": 1}
         cache.set("doc1", "plugin", {}, result)
         cached = cache.get("doc2", "plugin", {})
         assert cached is None
 
-    def test_corrupt_cache_returns_none(self, cache, cache_dir):
+    def test_corrupt_cache_returns_none(self, cache_dir):
         """Cache corrompido retorna None e limpa o arquivo"""
+        cache = CacheManager(cache_dir, mem_size=0)  # força leitura do disco
         cache.set("doc1", "plugin", {}, {"data": 1})
 
         # Corromper o arquivo de cache
@@ -85,6 +107,71 @@ class TestCacheManager:
         # Arquivo corrompido deve ter sido removido
         assert not cache_files[0].exists()
 
+    def test_written_with_highest_protocol(self, cache, cache_dir):
+        cache.set("doc1", "plugin", {}, {"data": (1, 2)})
+        raw = next(cache_dir.glob("*.pkl")).read_bytes()
+        assert raw[:2] == bytes([0x80, pickle.HIGHEST_PROTOCOL])
+        # Tipos Python preservados (tupla não vira lista)
+        assert cache.get("doc1", "plugin", {}) == {"data": (1, 2)}
+
+    def test_numpy_array_roundtrip(self, cache):
+        np = pytest.importorskip("numpy")
+        arr = np.arange(1 << 16, dtype=np.float64)
+        cache.set("doc1", "plugin", {}, {"embedding": arr})
+        cached = cache.get("doc1", "plugin", {})
+        assert cached["embedding"].dtype == arr.dtype
+        assert np.array_equal(cached["embedding"], arr)
+
+    def test_empty_cache_file_returns_none(self, cache_dir):
+        """Arquivo vazio (mmap de 0 bytes falha) é tratado como corrompido"""
+        cache = CacheManager(cache_dir, mem_size=0)
+        cache.set("doc1", "plugin", {}, {"data": 1})
+        cache_file = next(cache_dir.glob("*.pkl"))
+        cache_file.write_bytes(b"")
+        assert cache.get("doc1", "plugin", {}) is None
+        assert not cache_file.exists()
+
+    def test_memory_hit_skips_disk(self, cache):
+        cache.set("doc1", "plugin", {}, {"v": 1})
+        with patch("builtins.open", side_effect=AssertionError("disco lido")):
+            assert cache.get("doc1", "plugin", {}) == {"v": 1}
+        assert cache.stats()["hits"] == 1
+
+    def test_memory_hit_returns_fresh_copy(self, cache):
+        """Mutar o resultado devolvido não altera o que está em cache"""
+        result = {"v": [1]}
+        cache.set("doc1", "plugin", {}, result)
+        result["v"].append(2)
+        first = cache.get("doc1", "plugin", {})
+        first["v"].append(3)
+        assert cache.get("doc1", "plugin", {}) == {"v": [1]}
+
+    def test_disk_hit_populates_memory(self, cache_dir):
+        CacheManager(cache_dir).set("doc1", "plugin", {}, {"v": 1})
+        fresh = CacheManager(cache_dir)  # "restart": memória vazia
+        assert fresh.get("doc1", "plugin", {}) == {"v": 1}
+        with patch("builtins.open", side_effect=AssertionError("disco lido")):
+            assert fresh.get("doc1", "plugin", {}) == {"v": 1}
+
+    def test_disk_hit_without_exists_probe(self, cache_dir):
+        CacheManager(cache_dir).set("doc1", "plugin", {}, {"v": 1})
+        fresh = CacheManager(cache_dir, mem_size=0)
+        with patch.object(Path, "exists", side_effect=AssertionError("stat extra")):
+            assert fresh.get("doc1", "plugin", {}) == {"v": 1}
+            assert fresh.get("doc2", "plugin", {}) is None
+
+    def test_memory_layer_bounded(self, cache_dir):
+        cache = CacheManager(cache_dir, mem_size=2)
+        for i in range(3):
+            cache.set(f"doc{i}", "plugin", {}, {"v": i})
+        assert len(cache._mem) == 2
+        assert cache.get("doc0", "plugin", {}) == {"v": 0}  # volta do disco
+
+    def test_invalidate_drops_memory(self, cache):
+        cache.set("doc1", "plugin", {}, {"v": 1})
+        cache.invalidate(doc_id="doc1")
+        assert cache.get("doc1", "plugin", {}) is None
+
     def test_overwrite_cache(self, cache):
         cache.set("doc1", "plugin", {}, {"v": 1})
         cache.set("doc1", "plugin", {}, {"v": 2})
@@ -140,6 +227,54 @@ class TestDependencyResolver:
         with pytest.raises(ValueError, match="circular"):
             resolver.resolve(["a"])
 
+    def test_cycle_message_lists_only_cycle(self, resolver):
+        """Mensagem traz o ciclo fechado, sem o plugin que só depende dele"""
+        resolver.add_plugin("a", make_meta("a", requires=["b"]))
+        resolver.add_plugin("b", make_meta("b", requires=["c"]))
+        resolver.add_plugin("c", make_meta("c", requires=["b"]))
+        resolver.build_graph()
+        with pytest.raises(ValueError) as exc:
+            resolver.resolve(["a"])
+        chain = str(exc.value).split(": ", 1)[1].split(" -> ")
+        assert chain[0] == chain[-1]
+        assert set(chain) == {"b", "c"}
+
+    def test_deep_chain_no_recursion_limit(self, resolver):
+        import sys
+        n = sys.getrecursionlimit() + 100
+        resolver.add_plugin("p0", make_meta("p0"))
+        for i in range(1, n):
+            resolver.add_plugin(f"p{i}", make_meta(f"p{i}", requires=[f"p{i-1}"]))
+        resolver.build_graph()
+        result = resolver.resolve([f"p{n-1}"])
+        assert result == [f"p{i}" for i in range(n)]
+
+    def test_closure_precomputed_in_build_graph(self, resolver):
+        resolver.add_plugin("a", make_meta("a"))
+        resolver.add_plugin("b", make_meta("b", requires=["a"]))
+        resolver.add_plugin("c", make_meta("c", requires=["b"]))
+        resolver.build_graph()
+        assert resolver._closure["c"] == frozenset({"a", "b", "c"})
+        with patch.object(resolver, "_reachable") as reach:
+            assert resolver.resolve(["c"]) == ["a", "b", "c"]
+        reach.assert_not_called()
+
+    def test_ids_interned_in_graph(self, resolver):
+        """Strings montadas em runtime viram a mesma instância no grafo"""
+        dep_id = "".join(["ba", "se"])
+        resolver.add_plugin(dep_id, make_meta(dep_id, provides=["campo"]))
+        resolver.add_plugin("x", make_meta("x", requires=["".join(["ba", "se"])]))
+        resolver.add_plugin("y", make_meta("y", requires=["".join(["cam", "po"])]))
+        resolver.build_graph()
+        key = next(k for k in resolver.metadata if k == "base")
+        assert key is sys.intern("base")
+        assert next(iter(resolver.graph["x"])) is key
+        assert next(iter(resolver.graph["y"])) is key
+
+    def test_unknown_target_resolves_alone(self, resolver):
+        resolver.build_graph()
+        assert resolver.resolve(["ghost"]) == ["ghost"]
+
     def test_transitive_dependencies(self, resolver):
         resolver.add_plugin("a", make_meta("a"))
         resolver.add_plugin("b", make_meta("b", requires=["a"]))
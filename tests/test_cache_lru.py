@@ -223,6 +223,18 @@ class TestCachePersistence:
         assert cache_b.get("d3", "p", {})["v"] == 3
         assert len(cache_b._access_order) == 2
 
+    def test_disk_hit_unpickles_from_mmap(self, cache_dir):
+        """Hit no disco desserializa direto do mmap; a LRU em memória recebe os bytes depois"""
+        import mmap
+        import pickle
+        CacheManager(cache_dir).set("d1", "p", {}, {"v": 1})
+
+        cache = CacheManager(cache_dir)  # mem_size padrão, LRU vazia
+        with patch("qualia.core.cache.pickle.loads", wraps=pickle.loads) as loads:
+            assert cache.get("d1", "p", {}) == {"v": 1}
+        assert isinstance(loads.call_args.args[0], mmap.mmap)
+        assert len(cache._mem) == 1
+
 
 # =============================================================================
 # STATS
@@ -288,8 +300,18 @@ class TestBackwardCompat:
         for i in range(5):
             assert cache.get(f"d{i}", "p", {}) is None
 
-    def test_corrupt_cache_cleans_reverse_index(self, cache, cache_dir):
+    def test_clear_keeps_non_pickle_files(self, cache, cache_dir):
+        cache.set("d1", "p", {}, {"v": 1})
+        other = cache_dir / "notes.txt"
+        other.write_text("x")
+
+        cache.clear()
+        assert not list(cache_dir.glob("*.pkl"))
+        assert other.exists()
+
+    def test_corrupt_cache_cleans_reverse_index(self, cache_dir):
         """Arquivo corrompido limpa índices reversos (sem chaves zumbis)"""
+        cache = CacheManager(cache_dir, mem_size=0)  # força leitura do disco
         cache.set("d1", "p", {}, {"v": 1})
         assert "d1" in cache._doc_index
 
@@ -317,6 +339,26 @@ class TestBackwardCompat:
         assert cache.get("doc2", "p", {"y": 2, "x": 1})["ok"] is True
 
 
+# =============================================================================
+# SMALL CUTOFF
+# =============================================================================
+
+class TestSmallCutoff:
+
+    def test_tiny_result_not_stored(self, cache_dir):
+        cm = CacheManager(cache_dir, small_cutoff=256)
+        cm.set("d1", "p", {}, {"v": 1})
+        assert cm.get("d1", "p", {}) is None
+        assert not list(cache_dir.glob("*.pkl"))
+
+    def test_large_or_forced_result_stored(self, cache_dir):
+        cm = CacheManager(cache_dir, small_cutoff=256)
+        cm.set("d1", "p", {}, {"v": "x" * 512})
+        cm.set("d2", "p", {}, {"v": 1}, force=True)
+        assert cm.get("d1", "p", {}) is not None
+        assert cm.get("d2", "p", {}) == {"v": 1}
+
+
 # =============================================================================
 # INVALIDATE
 # =============================================================================
@@ -450,6 +492,20 @@ class TestInvalidateAfterRestart:
         assert cache_b.get("doc2", "plugin_a", {}) is None
         assert cache_b.get("doc1", "plugin_b", {})["v"] == 2
 
+    def test_invalidate_saves_index_once(self, cache_dir):
+        """Invalidar N entradas grava o índice uma vez, e o índice fica correto"""
+        cache = CacheManager(cache_dir)
+        for i in range(5):
+            cache.set("doc1", f"plugin_{i}", {}, {"v": i})
+        cache.set("doc2", "plugin_0", {}, {"v": 9})
+
+        with patch.object(cache, "_save_index", wraps=cache._save_index) as save:
+            cache.invalidate(doc_id="doc1")
+        assert save.call_count == 1
+
+        reloaded = CacheManager(cache_dir)
+        assert set(reloaded._doc_index) == {"doc2"}
+
     def test_clear_removes_index_file(self, cache_dir):
         """clear() deve remover .cache_index.json do disco"""
         cache = CacheManager(cache_dir)
@@ -90,6 +90,16 @@ class TestListCommand:
         # Modo detailed mostra colunas extras
         assert "Fornece" in result.output or "fornece" in result.output.lower()
 
+    def test_list_json(self, runner):
+        result = runner.invoke(cli, ["list", "--json", "--type", "visualizer"])
+        assert result.exit_code == 0
+        plugins = json.loads(result.output)
+        ids = {p["id"] for p in plugins}
+        assert "wordcloud_d3" in ids
+        assert "word_frequency" not in ids
+        assert {"id", "type", "name", "version", "provides", "requires"} <= set(plugins[0])
+        assert all(p["type"] == "visualizer" for p in plugins)
+
 
 # =============================================================================
 # ANALYZE COMMAND
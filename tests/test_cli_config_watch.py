@@ -615,3 +615,66 @@ class TestQualiaFileHandler:
         # Nomes devem ser distintos (contem path relativo)
         names = sorted(f.name for f in result_files)
         assert names[0] != names[1]
+
+    def test_handler_symlinked_watch_dir_keeps_relative_name(self, tmp_path):
+        """Evento com path real sob watch_dir simbólico ainda gera nome relativo"""
+        from qualia.cli.commands.watch import QualiaFileHandler
+
+        real_dir = tmp_path / "real"
+        (real_dir / "sub").mkdir(parents=True)
+        link_dir = tmp_path / "link"
+        link_dir.symlink_to(real_dir, target_is_directory=True)
+
+        handler = QualiaFileHandler(
+            plugin_id="word_frequency",
+            config={},
+            pattern="*.txt",
+            watch_dir=link_dir,
+        )
+
+        assert handler._relative_name(str(link_dir / "sub" / "doc.txt")) == "sub_doc"
+        assert handler._relative_name(str(real_dir / "sub" / "doc.txt")) == "sub_doc"
+
+    def test_handler_drops_repeated_events_without_waiting(self, tmp_path):
+        """Eventos repetidos do mesmo save são descartados sem _wait_stable"""
+        from unittest.mock import patch
+        from qualia.cli.commands.watch import QualiaFileHandler
+        from watchdog.events import FileModifiedEvent
+
+        handler = QualiaFileHandler(
+            plugin_id="word_frequency",
+            config={},
+            pattern="*.txt",
+        )
+
+        txt_file = tmp_path / "salvo.txt"
+        txt_file.write_text("Texto salvo pelo editor em rajada de eventos.")
+        handler._process_file(str(txt_file))
+        assert handler.stats["processed"] == 1
+
+        with patch.object(handler, "_wait_stable") as mock_wait:
+            handler.on_modified(FileModifiedEvent(str(txt_file)))
+            handler.on_modified(FileModifiedEvent(str(txt_file)))
+            mock_wait.assert_not_called()
+
+        assert handler.stats["processed"] == 1
+        assert handler.stats["skipped"] == 2
+
+    def test_handler_pattern_checked_before_waiting(self, tmp_path):
+        """Arquivo fora do padrão não passa pelo _wait_stable"""
+        from unittest.mock import patch
+        from qualia.cli.commands.watch import QualiaFileHandler
+        from watchdog.events import FileCreatedEvent
+
+        handler = QualiaFileHandler(
+            plugin_id="word_frequency",
+            config={},
+            pattern="*.txt",
+        )
+
+        swap = tmp_path / ".notas.swp"
+        swap.write_bytes(b"\x00")
+
+        with patch.object(handler, "_wait_stable") as mock_wait:
+            handler.on_created(FileCreatedEvent(str(swap)))
+            mock_wait.assert_not_called()
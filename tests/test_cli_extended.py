@@ -1060,6 +1060,15 @@ class TestLoadConfigValidation:
         with pytest.raises(click.BadParameter, match="dict"):
             load_config(config_file)
 
+    def test_load_config_yaml_suffix_case_insensitive(self, tmp_path):
+        """.YML em maiúsculas é lido como YAML"""
+        from qualia.cli.commands.utils import load_config
+
+        config_file = tmp_path / "CONFIG.YML"
+        config_file.write_text("min_length: 3\n")
+
+        assert load_config(config_file) == {"min_length": 3}
+
 
 # =============================================================================
 # FIX 7: CLI double discovery removed
@@ -354,6 +354,29 @@ class TestChooseFileFromExamples:
             os.chdir(old_cwd)
 
 
+    @patch("qualia.cli.interactive.utils.get_int_choice", return_value=1)
+    def test_listing_cached_until_dir_changes(self, mock_choice, tmp_path, monkeypatch):
+        """Segunda visita reusa a listagem; arquivo novo muda o mtime e força releitura"""
+        import os
+        from qualia.cli.interactive import utils
+
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "examples").mkdir()
+        (tmp_path / "examples" / "a.txt").write_text("a")
+        os.utime(tmp_path / "examples", ns=(1, 1))
+
+        with patch.object(utils, "_EXAMPLES_CACHE", {}), \
+             patch.object(utils.os, "scandir", side_effect=os.scandir) as scandir:
+            assert utils._choose_file_from_examples() == os.path.join("examples", "a.txt")
+            utils._choose_file_from_examples()
+            assert scandir.call_count == 2   # examples/ e . lidos só na primeira visita
+
+            (tmp_path / "examples" / "b.txt").write_text("b")
+            utils._choose_file_from_examples()
+            assert scandir.call_count == 3   # só examples/ mudou
+        mock_choice.assert_called_with("Escolha", 1, 2)
+
+
 class TestChoosePlugin:
     """Testa choose_plugin (usa get_core().registry direto)"""
 
@@ -390,6 +413,30 @@ class TestChoosePlugin:
         assert result is not None
 
 
+    @patch("qualia.cli.interactive.utils.get_int_choice", return_value=2)
+    def test_choose_plugin_index_matches_sorted_listing(self, mock_choice):
+        """Índice escolhido resolve na mesma lista ordenada que foi exibida"""
+        from qualia.cli.interactive.utils import choose_plugin
+        from qualia.core.interfaces import PluginType
+
+        def meta(pid, ptype):
+            m = MagicMock(id=pid, type=ptype)
+            m.name = pid.upper()
+            return m
+
+        core = MagicMock()
+        core.registry = {
+            "zeta": meta("zeta", PluginType.ANALYZER),
+            "alpha": meta("alpha", PluginType.ANALYZER),
+            "viz": meta("viz", PluginType.VISUALIZER),
+        }
+        with patch("qualia.cli.commands.utils.get_core", return_value=core), \
+             patch("qualia.cli.interactive.utils.console") as mock_console:
+            assert choose_plugin("analyzer") == "zeta"
+        mock_choice.assert_called_once_with("Escolha", 1, 2)
+        mock_console.print.assert_called_once()
+
+
 class TestChooseFile:
     """Testa choose_file (linha 49 — opcao 2 examples)"""
 
@@ -446,6 +446,67 @@ class TestQualiaFileHandler:
                 handler.on_modified(event)
 
 
+    def test_handler_enqueues_events(self, tmp_path):
+        """Handler não imprime — enfileira detecção e resultado pra thread principal"""
+        from qualia.cli.commands.watch import QualiaFileHandler
+
+        with patch("qualia.cli.commands.watch.get_core") as mock_get_core:
+            mock_core = MagicMock()
+            mock_get_core.return_value = mock_core
+            mock_core.execute_plugin.return_value = {"ok": True}
+
+            handler = QualiaFileHandler("word_frequency", {}, None, "*.txt")
+
+            test_file = tmp_path / "fila.txt"
+            test_file.write_text("conteúdo")
+            handler._process_file(str(test_file))
+
+            events = [handler.events.get_nowait() for _ in range(handler.events.qsize())]
+            assert [kind for kind, _, _ in events] == ["detected", "ok"]
+            assert events[0][1] == "fila.txt"
+
+    def test_drain_events_and_render_table(self, tmp_path):
+        """_drain_events esvazia a fila; _render_table mostra eventos e contadores"""
+        from collections import deque
+        from qualia.cli.commands.watch import QualiaFileHandler, _drain_events, _render_table
+
+        with patch("qualia.cli.commands.watch.get_core"):
+            handler = QualiaFileHandler("word_frequency", {}, None, "*.txt")
+
+        recent = deque(maxlen=10)
+        assert _drain_events(handler, recent) is False
+
+        handler.events.put_nowait(("error", "ruim.txt", "falhou"))
+        handler.stats["errors"] = 1
+        assert _drain_events(handler, recent) is True
+        assert handler.events.empty()
+
+        table = _render_table(handler, recent)
+        assert table.row_count == 1
+        assert "Erros: [red]1[/red]" in table.caption
+
+    @patch("qualia.cli.commands.watch.Observer")
+    def test_watch_without_terminal_prints_each_event(self, mock_observer_cls, runner, tmp_path):
+        """Sem terminal (pipe) não usa Live — cada evento vira uma linha"""
+        import sys
+        watch_mod = sys.modules["qualia.cli.commands.watch"]
+
+        real_handler = watch_mod.QualiaFileHandler
+
+        def handler_with_event(*args, **kwargs):
+            handler = real_handler(*args, **kwargs)
+            handler.events.put_nowait(("ok", "novo.txt", "saida.json"))
+            return handler
+
+        with patch.object(watch_mod, "QualiaFileHandler", side_effect=handler_with_event), \
+             patch.object(watch_mod, "Live") as mock_live, \
+             patch("qualia.cli.commands.watch.time") as mock_time:
+            mock_time.sleep.side_effect = [None, KeyboardInterrupt()]
+            result = runner.invoke(cli, ["watch", str(tmp_path), "-p", "word_frequency"])
+
+        mock_live.assert_not_called()
+        assert "✓ processado novo.txt saida.json" in result.output
+
 # =============================================================================
 # EXPORT COMMAND — gaps (excel, csv com nested data, html com metadata)
 # =============================================================================
@@ -1199,20 +1260,46 @@ class TestTutorials:
         assert "pipelines" in tm.tutorials
         assert "complete_flow" in tm.tutorials
 
+    def test_tutorial_content_built_lazily(self):
+        """Conteúdo só é montado quando o tutorial é escolhido"""
+        from qualia.cli.interactive.tutorials import TutorialManager
+        with patch.object(TutorialManager, "_tutorial_pipelines", return_value="x" * 60) as build:
+            tm = TutorialManager()
+            build.assert_not_called()
+            with patch("qualia.cli.interactive.tutorials.console"), \
+                 patch("qualia.cli.interactive.tutorials.get_int_choice", return_value=4), \
+                 patch.object(tm, "_show_tutorial") as mock_show:
+                tm.show_menu()
+            build.assert_called_once()
+            mock_show.assert_called_once_with("Pipelines Complexos", "x" * 60)
+
+    def test_show_menu_reuses_owner_menu(self):
+        """show_menu redesenha o banner pelo menu dono, sem instanciar outro menu"""
+        from qualia.cli.interactive.tutorials import TutorialManager
+        owner = MagicMock()
+        tm = TutorialManager(owner)
+        with patch("qualia.cli.interactive.tutorials.console"), \
+             patch("qualia.cli.interactive.tutorials.get_int_choice", return_value=6), \
+             patch("qualia.cli.interactive.menu.QualiaInteractiveMenu") as menu_cls:
+            tm.show_menu()
+        owner.show_banner.assert_called_once()
+        menu_cls.assert_not_called()
+
     def test_tutorial_content_not_empty(self):
         """Cada tutorial deve ter título e conteúdo não vazio"""
         from qualia.cli.interactive.tutorials import TutorialManager
         tm = TutorialManager()
         for key, info in tm.tutorials.items():
             assert info["title"], f"Tutorial '{key}' sem título"
-            assert info["content"], f"Tutorial '{key}' sem conteúdo"
-            assert len(info["content"]) > 50, f"Tutorial '{key}' conteúdo muito curto"
+            content = info["build"]()
+            assert content, f"Tutorial '{key}' sem conteúdo"
+            assert len(content) > 50, f"Tutorial '{key}' conteúdo muito curto"
 
     def test_tutorial_basic_analysis_content(self):
         """Tutorial de análise básica menciona word_frequency"""
         from qualia.cli.interactive.tutorials import TutorialManager
         tm = TutorialManager()
-        content = tm.tutorials["basic_analysis"]["content"]
+        content = tm.tutorials["basic_analysis"]["build"]()
         assert "word_frequency" in content
         assert "analyze" in content.lower()
 
@@ -1220,7 +1307,7 @@ class TestTutorials:
         """Tutorial de visualização menciona wordcloud e chart"""
         from qualia.cli.interactive.tutorials import TutorialManager
         tm = TutorialManager()
-        content = tm.tutorials["visualization"]["content"]
+        content = tm.tutorials["visualization"]["build"]()
         assert "wordcloud_d3" in content
         assert "frequency_chart_plotly" in content
 
@@ -1228,7 +1315,7 @@ class TestTutorials:
         """Tutorial de pipelines menciona YAML e steps"""
         from qualia.cli.interactive.tutorials import TutorialManager
         tm = TutorialManager()
-        content = tm.tutorials["pipelines"]["content"]
+        content = tm.tutorials["pipelines"]["build"]()
         assert "yaml" in content.lower()
         assert "steps" in content.lower()
 
@@ -1236,14 +1323,14 @@ class TestTutorials:
         """Tutorial de fluxo completo menciona teams_cleaner"""
         from qualia.cli.interactive.tutorials import TutorialManager
         tm = TutorialManager()
-        content = tm.tutorials["complete_flow"]["content"]
+        content = tm.tutorials["complete_flow"]["build"]()
         assert "teams_cleaner" in content
 
     def test_tutorial_transcript_cleaning_content(self):
         """Tutorial de limpeza menciona Teams"""
         from qualia.cli.interactive.tutorials import TutorialManager
         tm = TutorialManager()
-        content = tm.tutorials["transcript_cleaning"]["content"]
+        content = tm.tutorials["transcript_cleaning"]["build"]()
         assert "Teams" in content
 
     def test_show_tutorial_renders_panel(self):
@@ -1293,7 +1380,7 @@ class TestTutorials:
                         # Reimplementar lógica simplificada do show_menu
                         tutorial_list = list(tm.tutorials.items())
                         key, info = tutorial_list[0]  # choice=1
-                        tm._show_tutorial(info["title"], info["content"])
+                        tm._show_tutorial(info["title"], info["build"]())
 
                     mock_show.assert_called_once()
 
@@ -1428,6 +1515,19 @@ class TestUtilsEdgeCases:
             result = parse_params(("invalid_no_equals",))
         assert result == {}
 
+    def test_parse_params_json_and_plain_strings(self):
+        """Valores com cara de JSON são decodificados; o resto fica como string"""
+        from qualia.cli.commands.utils import parse_params
+
+        result = parse_params((
+            "colormap=viridis", "words=[1, 2]", "ratio=0.5", "opts={\"a\": 1}",
+            "empty=", "missing=null", "broken=[1,",
+        ))
+        assert result == {
+            "colormap": "viridis", "words": [1, 2], "ratio": 0.5, "opts": {"a": 1},
+            "empty": "", "missing": None, "broken": "[1,",
+        }
+
     def test_display_result_pretty_complex_data(self):
         """display_result_pretty exibe '<dados complexos>' para dados grandes"""
         from qualia.cli.commands.utils import display_result_pretty
@@ -1830,3 +1930,61 @@ class TestVisualizeCommandEdgeCases:
 
             assert result.exit_code == 0
             assert "Tamanho" in result.output or "KB" in result.output
+
+    def test_load_data_large_json_uses_mmap(self, tmp_path):
+        """JSON acima do threshold é lido via mmap + orjson e produz o mesmo resultado"""
+        orjson = pytest.importorskip("orjson")
+        import qualia.cli.commands.utils as utils_mod
+
+        data = {"word_frequencies": {f"w{i}": i for i in range(200)}}
+        data_file = tmp_path / "big.json"
+        data_file.write_text(json.dumps(data))
+
+        with patch.object(utils_mod, "_MMAP_THRESHOLD", 10), \
+                patch.object(orjson, "loads", wraps=orjson.loads) as loads:
+            assert utils_mod.load_data(data_file) == data
+        loads.assert_called_once()
+
+    def test_load_data_large_json_with_nan_falls_back_to_json(self, tmp_path):
+        """orjson recusa NaN (gravado pelo json.dumps) — cai no json.load"""
+        import math
+        import sys
+        import types
+        import qualia.cli.commands.utils as utils_mod
+
+        class FakeDecodeError(ValueError):
+            pass
+
+        fake_orjson = types.SimpleNamespace(
+            JSONDecodeError=FakeDecodeError,
+            loads=MagicMock(side_effect=FakeDecodeError("NaN")),
+        )
+        data_file = tmp_path / "big.json"
+        data_file.write_text(json.dumps({"x": float("nan"), "pad": "a" * 50}))
+
+        with patch.object(utils_mod, "_MMAP_THRESHOLD", 10), \
+                patch.dict(sys.modules, {"orjson": fake_orjson}):
+            data = utils_mod.load_data(data_file)
+        fake_orjson.loads.assert_called_once()
+        assert math.isnan(data["x"])
+
+    def test_load_data_small_json_and_yaml(self, tmp_path):
+        """JSON pequeno segue pelo json.load normal; YAML por safe_load"""
+        from qualia.cli.commands.utils import load_data
+
+        json_file = tmp_path / "small.json"
+        json_file.write_text(json.dumps({"gato": 5}))
+        yaml_file = tmp_path / "small.yml"
+        yaml_file.write_text(yaml.dump([1, 2]))
+
+        assert load_data(json_file) == {"gato": 5}
+        assert load_data(yaml_file) == [1, 2]
+
+    def test_load_data_unsupported_suffix(self, tmp_path):
+        """Extensão fora de JSON/YAML levanta ValueError"""
+        from qualia.cli.commands.utils import load_data
+
+        xml_file = tmp_path / "data.xml"
+        xml_file.write_text("<data/>")
+        with pytest.raises(ValueError, match="não suportado"):
+            load_data(xml_file)
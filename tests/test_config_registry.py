@@ -182,6 +182,12 @@ class TestValidationType:
         ok, _ = reg.validate_config("p", {"d": {"a": 1}})
         assert ok
 
+    def test_unknown_type_rejected(self):
+        reg = _registry_with_plugins({"p": {"x": {"type": "tuple", "default": ()}}})
+        ok, errors = reg.validate_config("p", {"x": (1, 2)})
+        assert not ok
+        assert "tipo desconhecido" in errors[0]
+
     def test_unknown_param_rejected(self):
         reg = _registry_with_plugins({"p": {"n": {"type": "integer", "default": 1}}})
         ok, errors = reg.validate_config("p", {"unknown_param": 42})
@@ -259,6 +265,33 @@ class TestValidationOptions:
         ok, _ = reg.validate_config("p", {})
         assert ok
 
+    def test_unhashable_options_still_validated(self):
+        reg = _registry_with_plugins({
+            "p": {"cols": {"type": "list", "options": [["a"], ["b"]], "default": ["a"]}}
+        })
+        assert reg.validate_config("p", {"cols": ["b"]})[0]
+        assert not reg.validate_config("p", {"cols": ["c"]})[0]
+
+    def test_public_schema_stays_dict(self):
+        reg = _registry_with_plugins({
+            "p": {"lang": {"type": "choice", "options": ["pt", "en"], "default": "pt"}}
+        })
+        # Espelho interno é slots; o schema exposto continua JSON-friendly
+        assert not hasattr(reg._params["p"]["lang"], "__dict__")
+        assert reg.get_plugin_schema("p")["parameters"]["lang"]["options"] == ["pt", "en"]
+
+    def test_validator_compiled_once_per_plugin(self):
+        reg = _registry_with_plugins({
+            "p": {"lang": {"type": "choice", "options": ["pt", "en"], "default": "pt"}}
+        })
+        validator = reg._validators["p"]
+        reg.validate_config("p", {"lang": "pt"})
+        reg.validate_config("p", {"lang": "fr"})
+        assert reg._validators["p"] is validator
+        ok, errors = validator({"lang": "fr", "x": 1})
+        assert not ok
+        assert len(errors) == 2
+
 
 # ============================================================================
 # Text size category
@@ -280,6 +313,11 @@ class TestTextSizeCategory:
     def test_zero_words(self):
         assert ConfigurationRegistry.get_text_size_category(0) == "short_text"
 
+    def test_batch_matches_scalar(self):
+        counts = [0, 500, 501, 5000, 5001, 50000]
+        batch = ConfigurationRegistry.get_text_size_categories(counts)
+        assert list(batch) == [ConfigurationRegistry.get_text_size_category(c) for c in counts]
+
 
 # ============================================================================
 # Resolução de config (cascata)
@@ -325,6 +363,16 @@ class TestConfigResolution:
         reg = _registry_with_plugins({"p": {}})
         assert reg.get_config_for_plugin("missing") == {}
 
+    def test_returned_config_is_a_fresh_dict(self):
+        reg = _registry_with_plugins({
+            "p": {"n": {"type": "integer", "default": 50,
+                        "text_size_adjustments": {"short_text": 20}}}
+        })
+        config = reg.get_config_for_plugin("p", text_size="short_text")
+        config["n"] = 999
+        assert reg.get_config_for_plugin("p", text_size="short_text") == {"n": 20}
+        assert reg.get_config_for_plugin("p") == {"n": 50}
+
 
 # ============================================================================
 # Visão consolidada
@@ -333,6 +333,80 @@ class TestEngineEdgeCases:
         consumer.analyze.assert_called_once()
         assert result == {"consumed": True}
 
+    def test_dependency_chain_resolves_each_plugin_once(self, core):
+        """Cadeia a → b → c: cada plugin executa uma vez, resolve memoizado"""
+        plugins = {}
+        for pid, provides, requires in [
+            ("chain_a", ["fa"], []),
+            ("chain_b", ["fb"], ["fa"]),
+            ("chain_c", ["fc"], ["fb"]),
+        ]:
+            plugin = MagicMock()
+            meta = PluginMetadata(
+                id=pid, type=PluginType.ANALYZER, name=pid, description="",
+                version="1.0", provides=provides, requires=requires,
+            )
+            plugin.meta.return_value = meta
+            plugin.validate_config.return_value = (True, None)
+            plugin.analyze.return_value = {provides[0]: pid}
+            core.loader.loaded_plugins[pid] = plugin
+            core.registry[pid] = meta
+            plugins[pid] = plugin
+
+        core.resolver = DependencyResolver()
+        for pid, meta in core.registry.items():
+            core.resolver.add_plugin(pid, meta)
+        core.resolver.build_graph()
+
+        with patch.object(core.resolver, "resolve", wraps=core.resolver.resolve) as resolve:
+            core.execute_plugin("chain_c", core.add_document("chain1", "texto"))
+            core.execute_plugin("chain_c", core.add_document("chain2", "texto"))
+
+        for plugin in plugins.values():
+            assert plugin.analyze.call_count == 2
+        # chain_c e chain_b resolvidos uma vez cada, reaproveitados no 2º documento
+        assert resolve.call_count == 2
+        # b recebe o resultado de a; c recebe a e b
+        _, _, ctx_b = plugins["chain_b"].analyze.call_args.args
+        _, _, ctx_c = plugins["chain_c"].analyze.call_args.args
+        assert set(ctx_b) == {"chain_a"}
+        assert set(ctx_c) == {"chain_a", "chain_b"}
+
+    def test_cache_hint_never_skips_cache_set(self, core):
+        """cache_hint='never' no metadata: resultado não vai para o cache"""
+        meta = core.registry["word_frequency"]
+        doc = core.add_document("hint_doc", "gato gato cachorro")
+        with patch.object(meta, "cache_hint", "never"), \
+                patch.object(core.cache, "set") as cache_set:
+            core.execute_plugin("word_frequency", doc)
+        cache_set.assert_not_called()
+
+    def test_tiny_result_not_persisted_by_default(self, core, temp_dir):
+        """Engine liga o small_cutoff: resultado minúsculo é recomputado, não gravado"""
+        from qualia.core.engine import CACHE_SMALL_CUTOFF
+
+        plugin = MagicMock()
+        meta = PluginMetadata(
+            id="tiny", type=PluginType.ANALYZER, name="tiny", description="", version="1.0",
+        )
+        plugin.meta.return_value = meta
+        plugin.validate_config.return_value = (True, None)
+        plugin.analyze.return_value = {"n": 1}
+        core.loader.loaded_plugins["tiny"] = plugin
+        core.registry["tiny"] = meta
+
+        doc = core.add_document("tiny_doc", "texto")
+        core.execute_plugin("tiny", doc)
+        core.execute_plugin("tiny", doc)
+
+        assert core.cache.small_cutoff == CACHE_SMALL_CUTOFF
+        assert plugin.analyze.call_count == 2
+        assert not list((temp_dir / "cache").glob("*.pkl"))
+
+        # Configurável: 0 volta a gravar tudo
+        assert QualiaCore(plugins_dir=temp_dir / "vazio", cache_dir=temp_dir / "c2",
+                          cache_small_cutoff=0).cache.small_cutoff == 0
+
     def test_execute_plugin_visualizer(self, core, temp_dir):
         """Visualizer cujo render retorna dict com html ou base64"""
         viz = MagicMock()
@@ -515,6 +589,26 @@ class TestBasePluginValidation:
         result = plugin._validate_config({"flag": 0})
         assert result["flag"] is False
 
+    def test_visualizer_validator_compiled_once(self):
+        """Schema do visualizer é compilado uma vez e reaproveitado"""
+        calls = []
+
+        class CountViz(BaseVisualizerPlugin):
+            def meta(self):
+                calls.append(1)
+                return PluginMetadata(
+                    id="count_viz", type=PluginType.VISUALIZER,
+                    name="CountViz", description="Test", version="1.0",
+                    parameters={"n": {"type": "int", "default": 1}},
+                )
+
+        plugin = CountViz()
+        assert plugin._validate_config({"n": "3"}) == {"n": 3}
+        assert plugin._validate_config({}) == {"n": 1}
+        with pytest.raises(ValueError, match="desconhecido"):
+            plugin._validate_config({"m": 1})
+        assert len(calls) == 1
+
 
 class TestProvidesValidation:
     """Testes de validação do contrato de provides no engine"""
@@ -632,6 +726,78 @@ class TestProvidesContract:
         with pytest.raises(ValueError, match="needed_field"):
             plugin._validate_data({})
 
+    def test_visualizer_without_requires_skips_data_check(self):
+        class FreeViz(BaseVisualizerPlugin):
+            def meta(self):
+                return PluginMetadata(
+                    id="free_viz", type=PluginType.VISUALIZER,
+                    name="FreeViz", description="Test", version="1.0",
+                )
+
+            def _render_impl(self, data, config):
+                return "<html></html>"
+
+        class CustomCheckViz(FreeViz):
+            def _validate_data(self, data):
+                raise ValueError("checagem própria")
+
+        assert FreeViz()._data_check is None
+        assert FreeViz().render({}, {}) == {"html": "<html></html>"}
+        # Override de _validate_data continua sendo chamado mesmo sem requires
+        with pytest.raises(ValueError, match="checagem própria"):
+            CustomCheckViz().render({}, {})
+
+    def test_visualizer_validate_data_reports_first_missing_in_order(self):
+        class MultiViz(BaseVisualizerPlugin):
+            def meta(self):
+                return PluginMetadata(
+                    id="multi_viz", type=PluginType.VISUALIZER,
+                    name="MultiViz", description="Test", version="1.0",
+                    requires=["a", "b", "c"],
+                )
+
+        plugin = MultiViz()
+        plugin._validate_data({"a": 1, "b": 2, "c": 3})
+        with pytest.raises(ValueError, match="'b'"):
+            plugin._validate_data({"a": 1})
+
+    def test_visualizer_missing_field_message_truncated(self):
+        class NeedyViz(BaseVisualizerPlugin):
+            def meta(self):
+                return PluginMetadata(
+                    id="needy_viz", type=PluginType.VISUALIZER,
+                    name="NeedyViz", description="Test", version="1.0",
+                    requires=["needed_field"],
+                )
+
+        with pytest.raises(ValueError) as exc:
+            NeedyViz()._validate_data({f"k{i}": i for i in range(1000)})
+        assert "'k0'" in str(exc.value)
+        assert "(+980)" in str(exc.value)
+        assert "'k999'" not in str(exc.value)
+
+    def test_visualizer_meta_resolved_once(self):
+        """render repetido não chama meta() de novo"""
+
+        class CountingViz(BaseVisualizerPlugin):
+            calls = 0
+
+            def meta(self):
+                CountingViz.calls += 1
+                return PluginMetadata(
+                    id="counting_viz", type=PluginType.VISUALIZER,
+                    name="CountingViz", description="Test", version="1.0",
+                    requires=["x"],
+                )
+
+            def _render_impl(self, data, config):
+                return "<html></html>"
+
+        plugin = CountingViz()
+        for _ in range(3):
+            plugin.render({"x": 1}, {})
+        assert CountingViz.calls == 1
+
 
 class TestModels:
     """Testes para models.py — ExecutionContext"""
@@ -693,6 +859,14 @@ class TestInterfaces:
         deps = meta.get_dependencies()
         assert deps == set()
 
+    def test_plugin_metadata_rejects_unknown_cache_hint(self):
+        """cache_hint fora de auto/always/never falha na criação (ex: 'Never')"""
+        with pytest.raises(ValueError, match="cache_hint"):
+            PluginMetadata(
+                id="typo", type=PluginType.ANALYZER, name="Test",
+                description="Test", version="1.0", cache_hint="Never",
+            )
+
 
 class TestValidateAndConvert:
     """Testa _validate_and_convert com todas as branches de tipo."""
@@ -749,6 +923,29 @@ class TestValidateAndConvert:
         assert "keep" in result
         assert "skip" not in result
 
+    def test_result_keeps_schema_order(self):
+        from qualia.core.base_plugins import _validate_and_convert
+        params = {"a": {"type": "int", "default": 1}, "b": {"type": "str", "default": "x"}}
+        result = _validate_and_convert({"b": "y", "a": "2"}, params)
+        assert list(result.items()) == [("a", 2), ("b", "y")]
+
+    def test_analyzer_validator_compiled_once(self):
+        calls = []
+
+        class CountAnalyzer(BaseAnalyzerPlugin):
+            def meta(self):
+                calls.append(1)
+                return PluginMetadata(
+                    id="count_an", type=PluginType.ANALYZER,
+                    name="CountAn", description="Test", version="1.0",
+                    parameters={"n": {"type": "int", "default": 1}},
+                )
+
+        plugin = CountAnalyzer()
+        assert plugin._validate_config({"n": "5"}) == {"n": 5}
+        assert plugin._validate_config({}) == {"n": 1}
+        assert len(calls) == 1
+
     def test_default_applied_when_missing(self):
         from qualia.core.base_plugins import _validate_and_convert
         params = {"count": {"type": "int", "default": 42}}
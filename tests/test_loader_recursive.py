@@ -1,5 +1,6 @@
 """Testes do discovery recursivo de plugins."""
 
+import json
 import pytest
 from pathlib import Path
 from qualia.core.loader import PluginLoader
@@ -139,6 +140,44 @@ class DupAnalyzer(BaseAnalyzerPlugin):
         assert "flat_plugin" in discovered
         assert "duplicado" in caplog.text.lower() or "duplicado" in str(caplog.records)
 
+    def test_imports_run_in_worker_threads(self, plugin_tree, monkeypatch):
+        """Pastas fora do índice são importadas no pool; registro segue a ordem das pastas"""
+        import threading
+        loader = PluginLoader(plugin_tree)
+        threads = []
+        original = loader._import_module
+
+        def spy(plugin_dir):
+            threads.append(threading.current_thread().name)
+            return original(plugin_dir)
+
+        monkeypatch.setattr(loader, "_import_module", spy)
+        discovered = loader.discover()
+        assert set(discovered) == {"flat_plugin", "nested_plugin", "deep_plugin"}
+        assert len(threads) == 3
+        assert all(name.startswith("qualia-discover") for name in threads)
+
+    def test_interfaces_and_non_classes_skipped(self, tmp_path):
+        """Interfaces importadas e atributos que não são classe não viram plugin"""
+        pdir = tmp_path / "iface_plugin"
+        pdir.mkdir()
+        (pdir / "__init__.py").write_text('''
+from qualia.core import BaseAnalyzerPlugin, PluginMetadata, PluginType
+from qualia.core.interfaces import IPlugin, IAnalyzerPlugin
+CONSTANTE = 42
+helper = lambda x: x
+
+class OnlyAnalyzer(BaseAnalyzerPlugin):
+    def meta(self):
+        return PluginMetadata(
+            id="only", name="Only", type=PluginType.ANALYZER,
+            version="0.1.0", description="only",
+        )
+''')
+        loader = PluginLoader(tmp_path)
+        assert list(loader.discover()) == ["only"]
+        assert loader.discovery_errors == []
+
 
 class TestEagerLoadAttribute:
 
@@ -186,3 +225,198 @@ class LazyTestPlugin(BaseAnalyzerPlugin):
         loader.discover()
         assert "lazy_test" not in loader.loaded_plugins
         assert "lazy_test" in loader._plugin_classes
+
+
+class TestWarmStartIndex:
+    """Índice de warm-start: pastas inalteradas não são importadas no discover."""
+
+    def test_first_discover_writes_index(self, plugin_tree, tmp_path_factory):
+        index = tmp_path_factory.mktemp("idx") / "plugin_index.json"
+        loader = PluginLoader(plugin_tree)
+        discovered = loader.discover(index)
+
+        assert index.exists()
+        assert set(discovered) == {"flat_plugin", "nested_plugin", "deep_plugin"}
+        assert loader._deferred == {}
+
+    def test_second_discover_uses_index(self, plugin_tree, tmp_path_factory):
+        index = tmp_path_factory.mktemp("idx") / "plugin_index.json"
+        PluginLoader(plugin_tree).discover(index)
+
+        loader = PluginLoader(plugin_tree)
+        discovered = loader.discover(index)
+
+        assert set(loader._deferred) == {"flat_plugin", "nested_plugin", "deep_plugin"}
+        assert loader._plugin_classes == {}
+        assert discovered["deep_plugin"].provides == ["cleaned_document", "quality_report"]
+
+    def test_deferred_plugin_imported_on_get(self, plugin_tree, tmp_path_factory):
+        index = tmp_path_factory.mktemp("idx") / "plugin_index.json"
+        PluginLoader(plugin_tree).discover(index)
+
+        loader = PluginLoader(plugin_tree)
+        loader.discover(index)
+        plugin = loader.get_plugin("flat_plugin")
+
+        assert plugin.meta().id == "flat_plugin"
+        assert "flat_plugin" not in loader._deferred
+        assert loader.get_plugin("flat_plugin") is plugin
+
+    def test_changed_plugin_dir_is_reimported(self, plugin_tree, tmp_path_factory):
+        index = tmp_path_factory.mktemp("idx") / "plugin_index.json"
+        PluginLoader(plugin_tree).discover(index)
+
+        init_file = plugin_tree / "flat_plugin" / "__init__.py"
+        init_file.write_text(init_file.read_text().replace('name="Flat"', 'name="Flat v2"'))
+
+        loader = PluginLoader(plugin_tree)
+        discovered = loader.discover(index)
+
+        assert discovered["flat_plugin"].name == "Flat v2"
+        assert "flat_plugin" not in loader._deferred
+        assert "nested_plugin" in loader._deferred
+
+    def test_index_from_other_plugins_dir_ignored(self, plugin_tree, tmp_path_factory):
+        index = tmp_path_factory.mktemp("idx") / "plugin_index.json"
+        index.write_text(json.dumps({
+            "version": 1, "plugins_dir": "/outro/lugar", "entries": {},
+        }))
+
+        loader = PluginLoader(plugin_tree)
+        loader.discover(index)
+
+        assert loader._deferred == {}
+        assert json.loads(index.read_text())["plugins_dir"] == str(plugin_tree)
+
+    def test_non_dict_index_treated_as_empty(self, plugin_tree, tmp_path_factory):
+        index = tmp_path_factory.mktemp("idx") / "plugin_index.json"
+        index.write_text("[]")
+
+        loader = PluginLoader(plugin_tree)
+        discovered = loader.discover(index)
+
+        assert set(discovered) == {"flat_plugin", "nested_plugin", "deep_plugin"}
+        assert loader.discovery_errors == []
+        assert isinstance(json.loads(index.read_text())["entries"], dict)
+
+    def test_truncated_index_entry_reimports_folder(self, plugin_tree, tmp_path_factory):
+        index = tmp_path_factory.mktemp("idx") / "plugin_index.json"
+        PluginLoader(plugin_tree).discover(index)
+        data = json.loads(index.read_text())
+        del data["entries"]["flat_plugin"]["signature"]
+        data["entries"]["documents/cleaners/deep_plugin"]["plugins"][0]["meta"] = {"id": "deep_plugin"}
+        index.write_text(json.dumps(data))
+
+        loader = PluginLoader(plugin_tree)
+        discovered = loader.discover(index)
+
+        assert set(discovered) == {"flat_plugin", "nested_plugin", "deep_plugin"}
+        assert loader.discovery_errors == []
+        assert set(loader._deferred) == {"nested_plugin"}
+
+    def test_eager_plugin_warmed_up_at_discover_with_index(self, tmp_path, tmp_path_factory):
+        plugin_dir = tmp_path / "eager_idx"
+        plugin_dir.mkdir()
+        (plugin_dir / "__init__.py").write_text('''
+from qualia.core import BaseAnalyzerPlugin, PluginMetadata, PluginType
+
+class EagerIdxPlugin(BaseAnalyzerPlugin):
+    EAGER_LOAD = True
+
+    def meta(self):
+        return PluginMetadata(
+            id="eager_idx", name="Eager", type=PluginType.ANALYZER,
+            version="1.0.0", description="Test",
+        )
+
+    def _analyze_impl(self, document, config, context):
+        return {}
+''')
+        index = tmp_path_factory.mktemp("idx") / "plugin_index.json"
+        PluginLoader(tmp_path).discover(index)
+
+        loader = PluginLoader(tmp_path)
+        loader.discover(index)
+        # Warm-up continua no discover (main thread), não no 1º get_plugin
+        assert "eager_idx" in loader.loaded_plugins
+        assert "eager_idx" not in loader._deferred
+        assert loader.is_eager("eager_idx") is True
+
+    def test_deferred_folder_imported_once_for_all_its_plugins(self, tmp_path, tmp_path_factory):
+        import sys
+        plugin_dir = tmp_path / "pair"
+        plugin_dir.mkdir()
+        (plugin_dir / "__init__.py").write_text('''
+from qualia.core import BaseAnalyzerPlugin, PluginMetadata, PluginType
+
+class PairA(BaseAnalyzerPlugin):
+    def meta(self):
+        return PluginMetadata(id="pair_a", name="A", type=PluginType.ANALYZER,
+                              version="1.0.0", description="a")
+    def _analyze_impl(self, document, config, context):
+        return {}
+
+class PairB(PairA):
+    def meta(self):
+        return PluginMetadata(id="pair_b", name="B", type=PluginType.ANALYZER,
+                              version="1.0.0", description="b")
+''')
+        index = tmp_path_factory.mktemp("idx") / "plugin_index.json"
+        PluginLoader(tmp_path).discover(index)
+
+        loader = PluginLoader(tmp_path)
+        loader.discover(index)
+        a, b = loader.get_plugin("pair_a"), loader.get_plugin("pair_b")
+
+        module = sys.modules["qualia_plugin_pair"]
+        assert type(a) is module.PairA
+        assert type(b) is module.PairB
+        assert loader._deferred == {}
+
+    def test_deferred_import_failure_keeps_entry_and_returns_none(
+            self, plugin_tree, tmp_path_factory, monkeypatch):
+        index = tmp_path_factory.mktemp("idx") / "plugin_index.json"
+        PluginLoader(plugin_tree).discover(index)
+
+        loader = PluginLoader(plugin_tree)
+        loader.discover(index)
+
+        def broken(plugin_dir):
+            raise ModuleNotFoundError("No module named 'sumiu'")
+
+        monkeypatch.setattr(loader, "_import_module", broken)
+        assert loader.get_plugin("flat_plugin") is None
+        assert loader.get_plugin("flat_plugin") is None
+        assert "flat_plugin" in loader._deferred
+        assert [err["type"] for err in loader.discovery_errors] == ["import_error"]
+
+    def test_missing_external_module_forces_reimport(self, tmp_path, tmp_path_factory, monkeypatch):
+        libs = tmp_path_factory.mktemp("libs")
+        (libs / "qualia_test_extlib.py").write_text("VALUE = 1\n")
+        monkeypatch.syspath_prepend(str(libs))
+        plugin_dir = tmp_path / "uses_ext"
+        plugin_dir.mkdir()
+        (plugin_dir / "__init__.py").write_text('''
+import qualia_test_extlib
+from qualia.core import BaseAnalyzerPlugin, PluginMetadata, PluginType
+
+class UsesExt(BaseAnalyzerPlugin):
+    def meta(self):
+        return PluginMetadata(id="uses_ext", name="Ext", type=PluginType.ANALYZER,
+                              version="1.0.0", description="ext")
+    def _analyze_impl(self, document, config, context):
+        return {}
+''')
+        index = tmp_path_factory.mktemp("idx") / "plugin_index.json"
+        PluginLoader(tmp_path).discover(index)
+        assert json.loads(index.read_text())["entries"]["uses_ext"]["imports"] == [
+            "qualia", "qualia_test_extlib"]
+
+        import sys
+        (libs / "qualia_test_extlib.py").unlink()
+        monkeypatch.delitem(sys.modules, "qualia_test_extlib", raising=False)
+
+        loader = PluginLoader(tmp_path)
+        discovered = loader.discover(index)
+        assert "uses_ext" not in discovered
+        assert [err["type"] for err in loader.discovery_errors] == ["import_error"]
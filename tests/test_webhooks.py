@@ -141,6 +141,14 @@ class TestWebhookStats:
         assert result["plugin_used"] == "word_frequency"
         assert "result" in result
 
+    async def test_last_processed_formatted_only_in_snapshot(self, generic_processor, mock_core):
+        from datetime import datetime
+        await generic_processor.process({"text": "teste"}, {})
+        assert isinstance(generic_processor.stats["last_processed"], int)
+        iso = generic_processor.stats_snapshot()["last_processed"]
+        assert datetime.fromisoformat(iso)
+        assert generic_processor.stats_snapshot()["total_processed"] == 1
+
 
 # =============================================================================
 # ENDPOINTS — INTEGRATION
@@ -189,6 +197,7 @@ class TestWebhookEndpoints:
         response = client.get("/webhook/stats")
         stats = response.json()["stats"]["generic"]
         assert stats["total_received"] >= 1
+        assert isinstance(stats["last_processed"], str)
 
 
 # =============================================================================